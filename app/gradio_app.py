@@ -10,19 +10,22 @@ Usage:
     python app/gradio_app.py gradio.port=7861 gradio.share=true
 """
 
+import asyncio
+import atexit
 import gradio as gr
+import httpx
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
 import time
+import uuid
 
-from reportlab.platypus import SimpleDocTemplate, Paragraph
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib.pagesizes import A4
-
+from research_assistant.cache import LLMCache, get_llm_cache, set_llm_cache
 from research_assistant.config.config import (
+    bootstrap,
     load_config,
-    load_env_file,
     check_required_env_vars,
 )
 from research_assistant.core.state import create_initial_research_state
@@ -33,11 +36,19 @@ from research_assistant.core.schemas import Analyst
 setup_logging(level="INFO")
 logger = get_logger(__name__)
 
-# Global state for the app
+# Minimum interval (seconds) between streamed UI updates while research runs
+PROGRESS_FLUSH_INTERVAL = 0.1
+
+# Translation table that strips line breaks from user input before logging
+_STRIP_NEWLINES = str.maketrans("", "", "\r\n")
+
+# Process-wide resources shared by all sessions. Per-user research state
+# (thread ID, current analysts) lives in a gr.State created per session.
 APP_STATE = {
     "graph": None,
-    "current_research": None,
-    "thread_id": None,
+    "llm_model": None,
+    "http_client": None,
+    "max_concurrency": None,
 }
 
 
@@ -45,26 +56,91 @@ APP_STATE = {
 # Helper Functions
 # ============================================================================
 
+def _get_http_client() -> httpx.Client:
+    """Return the process-wide pooled HTTP client used for sync LLM calls.
+    
+    The client is created on first use and closed at interpreter exit, so every
+    research run reuses warm keep-alive connections to the LLM provider. Async
+    calls use the SDK's own pooled client: an ``httpx.AsyncClient`` is bound to
+    the event loop serving it and can't be closed reliably from an exit hook.
+    
+    Returns:
+        Shared sync HTTP client.
+    """
+    if APP_STATE["http_client"] is None:
+        limits = httpx.Limits(max_connections=64, max_keepalive_connections=16)
+        APP_STATE["http_client"] = httpx.Client(limits=limits)
+        atexit.register(_close_http_client)
+    return APP_STATE["http_client"]
+
+
+def _close_http_client() -> None:
+    """Close the pooled HTTP client on shutdown."""
+    if APP_STATE["http_client"] is not None:
+        APP_STATE["http_client"].close()
+
+
+@lru_cache(maxsize=4)
+def _build_research_graph(llm_model: str, enable_interrupts: bool, detailed_prompts: bool):
+    """Build and compile the research graph once per configuration.
+    
+    Args:
+        llm_model: LLM model name.
+        enable_interrupts: Whether to enable human feedback interrupts.
+        detailed_prompts: Whether to use detailed prompts.
+        
+    Returns:
+        Compiled research graph.
+    """
+    from research_assistant.graphs.research_graph import create_research_system
+    system = create_research_system(
+        llm_model=llm_model,
+        enable_interrupts=enable_interrupts,
+        detailed_prompts=detailed_prompts,
+        http_client=_get_http_client(),
+    )
+    return system["graph"]
+
+
 def initialize_graph() -> None:
-    """Initialize the research graph on startup."""
+    """Initialize the research graph on startup.
+    
+    The compiled graph is memoized per configuration, so repeated calls
+    (startup plus lazy initialization from callbacks) reuse it.
+    """
     try:
         logger.info("Initializing research graph...")
         config = load_config()
 
-        from research_assistant.graphs.research_graph import create_research_system
-        system = create_research_system(
-            llm_model=config.llm.model,
+        # Serve repeated deterministic prompts (e.g. example topics) from cache
+        if get_llm_cache() is None:
+            set_llm_cache(LLMCache())
+
+        # Bound how many interview branches call the LLM/search APIs at once
+        APP_STATE["max_concurrency"] = config.get("performance", {}).get("max_concurrency")
+
+        APP_STATE["llm_model"] = config.llm.model
+        APP_STATE["graph"] = _build_research_graph(
+            APP_STATE["llm_model"],
             enable_interrupts=True,
             detailed_prompts=False
         )
-        
-        APP_STATE["graph"] = system["graph"]
         logger.info("Research graph initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize graph: {e}", exc_info=True)
         raise
 
 
+@lru_cache(maxsize=256)
+def _format_analyst_fields(name: str, role: str, affiliation: str, description: str) -> str:
+    """Render analyst fields as markdown (memoized on the field values)."""
+    return f"""### {name}
+**Role:** {role}  
+**Affiliation:** {affiliation}  
+**Focus:** {description}
+"""
+
+
 def format_analyst_for_display(analyst: Analyst) -> str:
     """Format analyst for display in UI.
     
@@ -74,11 +150,9 @@ def format_analyst_for_display(analyst: Analyst) -> str:
     Returns:
         Formatted markdown string.
     """
-    return f"""### {analyst.name}
-**Role:** {analyst.role}  
-**Affiliation:** {analyst.affiliation}  
-**Focus:** {analyst.description}
-"""
+    return _format_analyst_fields(
+        analyst.name, analyst.role, analyst.affiliation, analyst.description
+    )
 
 
 def create_progress_message(
@@ -120,16 +194,104 @@ def create_progress_message(
 # Core Research Functions
 # ============================================================================
 
-def start_research(
+def _session_graph(session: dict):
+    """Return the research graph matching a session's prompt setting.
+    
+    Graphs are memoized per configuration, so every call for the same setting
+    returns the same graph and checkpointer that hold the session's thread.
+    
+    Args:
+        session: Per-user session state.
+        
+    Returns:
+        Compiled research graph.
+    """
+    if APP_STATE["graph"] is None:
+        initialize_graph()
+    
+    if not session.get("detailed_prompts"):
+        return APP_STATE["graph"]
+    
+    return _build_research_graph(
+        APP_STATE["llm_model"],
+        enable_interrupts=True,
+        detailed_prompts=True
+    )
+
+
+def _run_config(thread_id: str) -> dict:
+    """Build the graph run config for a research thread.
+    
+    Args:
+        thread_id: Checkpointer thread ID of the research run.
+        
+    Returns:
+        RunnableConfig dictionary.
+    """
+    return {
+        "configurable": {"thread_id": thread_id},
+        "max_concurrency": APP_STATE["max_concurrency"],
+    }
+
+
+def format_analysts_markdown(analysts: list) -> str:
+    """Format the analyst review panel.
+    
+    Args:
+        analysts: Analyst instances to display.
+        
+    Returns:
+        Markdown string listing every analyst.
+    """
+    parts = [
+        "# Generated Analysts\n\n",
+        "Please review the analysts below and approve or provide feedback.\n\n",
+    ]
+    parts.extend(
+        f"{i}. {format_analyst_for_display(analyst)}\n"
+        for i, analyst in enumerate(analysts, 1)
+    )
+    return "".join(parts)
+
+
+async def _regenerate(session: dict, feedback_text: str) -> list:
+    """Resume the interrupted run with feedback so analysts are recreated.
+    
+    The graph is paused before ``human_feedback``; recording the feedback and
+    resuming routes back through ``create_analysts`` and pauses again, reusing
+    the existing checkpointed thread instead of starting a new run.
+    
+    Args:
+        session: Per-user session state (thread ID and current research).
+        feedback_text: Feedback for regeneration.
+        
+    Returns:
+        The regenerated analysts.
+    """
+    graph = _session_graph(session)
+    config = _run_config(session["thread_id"])
+    
+    await graph.aupdate_state(config, {"human_analyst_feedback": feedback_text})
+    await graph.ainvoke(None, config)
+    
+    state = await graph.aget_state(config)
+    analysts = state.values.get("analysts", [])
+    session["current_research"]["analysts"] = analysts
+    return analysts
+
+
+async def start_research(
+    session: dict,
     topic: str,
     max_analysts: int,
     max_turns: int,
     detailed_prompts: bool,
     progress=gr.Progress()
-) -> Tuple[str, str, str, str]:
+) -> Tuple[str, str, str, str, dict]:
     """Start research process.
     
     Args:
+        session: Per-user session state (thread ID and current research).
         topic: Research topic.
         max_analysts: Number of analysts to create.
         max_turns: Maximum interview turns.
@@ -137,7 +299,8 @@ def start_research(
         progress: Gradio progress tracker.
         
     Returns:
-        Tuple of (status, analysts_display, intermediate_results, error_message).
+        Tuple of (status, analysts_display, intermediate_results, error_message,
+        session).
     """
     try:
         # Validate inputs
@@ -146,7 +309,8 @@ def start_research(
                 "❌ Error: Topic must be at least 3 characters",
                 "",
                 "",
-                "Topic too short"
+                "Topic too short",
+                session
             )
         
         if max_analysts < 1 or max_analysts > 10:
@@ -154,24 +318,25 @@ def start_research(
                 "❌ Error: Number of analysts must be between 1 and 10",
                 "",
                 "",
-                "Invalid analyst count"
+                "Invalid analyst count",
+                session
             )
         
         # Sanitize user input before logging
-        sanitized_topic = topic.replace('\r\n', '').replace('\n', '').replace('\r', '')
+        sanitized_topic = topic.translate(_STRIP_NEWLINES)
         
         # Update progress
         progress(0.1, desc="Initializing research...")
         
-        # Initialize graph if needed
-        if APP_STATE["graph"] is None:
-            initialize_graph()
-        
-        graph = APP_STATE["graph"]
+        # Use the graph built for the requested prompt style
+        session["detailed_prompts"] = detailed_prompts
+        graph = _session_graph(session)
         
         # Create thread ID
-        thread_id = f"research-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-        APP_STATE["thread_id"] = thread_id
+        thread_id = (
+            f"research-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        )
+        session["thread_id"] = thread_id
         
         # Create initial state
         progress(0.2, desc="Creating analyst personas...")
@@ -180,14 +345,15 @@ def start_research(
             topic=topic.strip(),
             max_analysts=max_analysts
         )
+        initial_state["max_interview_turns"] = max_turns
         
-        config = {"configurable": {"thread_id": thread_id}}
+        config = _run_config(thread_id)
         
         # Start execution (will pause at human_feedback)
         logger.info(f"Starting research on: {sanitized_topic}")
         
         try:
-            graph.invoke(initial_state, config)
+            await graph.ainvoke(initial_state, config)
         except Exception as e:
             # Expected to interrupt at human_feedback
             logger.debug(f"Graph interrupted (expected): {e}")
@@ -195,7 +361,7 @@ def start_research(
         progress(0.4, desc="Analysts created, awaiting review...")
         
         # Get current state to retrieve analysts
-        state = graph.get_state(config)
+        state = await graph.aget_state(config)
         analysts = state.values.get("analysts", [])
         
         if not analysts:
@@ -203,28 +369,25 @@ def start_research(
                 "❌ Error: No analysts were created",
                 "",
                 "",
-                "Failed to create analysts"
+                "Failed to create analysts",
+                session
             )
         
-        # Store in app state
-        APP_STATE["current_research"] = {
+        # Store in session state
+        session["current_research"] = {
             "topic": topic,
             "analysts": analysts,
             "state": state
         }
         
         # Format analysts for display
-        analysts_md = "# Generated Analysts\n\n"
-        analysts_md += "Please review the analysts below and approve or provide feedback.\n\n"
-        
-        for i, analyst in enumerate(analysts, 1):
-            analysts_md += f"{i}. " + format_analyst_for_display(analyst) + "\n"
+        analysts_md = format_analysts_markdown(analysts)
         
         status = f"✅ Created {len(analysts)} analysts. Please review and approve."
         
         progress(0.5, desc="Awaiting analyst approval...")
         
-        return status, analysts_md, "", ""
+        return status, analysts_md, "", "", session
         
     except Exception as e:
         logger.error(f"Error starting research: {e}", exc_info=True)
@@ -232,115 +395,137 @@ def start_research(
             f"❌ Error: {str(e)}",
             "",
             "",
-            str(e)
+            str(e),
+            session
         )
 
 
-def approve_analysts(
+async def approve_analysts(
+    session: dict,
     feedback: str,
     progress=gr.Progress()
-) -> Tuple[str, str, str]:
+) -> AsyncIterator[Tuple[str, str, str]]:
     """Approve analysts and continue research.
     
+    Streams graph updates so the UI reflects real progress as each node
+    (interviews, report sections, final synthesis) completes.
+    
     Args:
+        session: Per-user session state (thread ID and current research).
         feedback: Human feedback ("approve" or custom feedback).
         progress: Gradio progress tracker.
         
-    Returns:
-        Tuple of (status, intermediate_results, final_report).
+    Yields:
+        Tuples of (status, intermediate_results, final_report).
     """
     try:
-        if APP_STATE["thread_id"] is None:
-            return (
+        if session.get("thread_id") is None:
+            yield (
                 "❌ Error: No active research. Please start research first.",
                 "",
                 ""
             )
+            return
         
-        graph = APP_STATE["graph"]
-        thread_id = APP_STATE["thread_id"]
-        config = {"configurable": {"thread_id": thread_id}}
+        graph = _session_graph(session)
+        thread_id = session["thread_id"]
+        config = _run_config(thread_id)
         
         # Update state with feedback
         feedback_text = feedback.strip() if feedback else "approve"
         
-        sanitized_feedback = feedback_text.replace('\r','').replace('\n','')
+        sanitized_feedback = feedback_text.translate(_STRIP_NEWLINES)
         logger.info(f"Processing feedback: {sanitized_feedback[:50]}")
         
         if feedback_text.lower() != "approve":
             # Regenerate analysts with feedback
             progress(0.3, desc="Regenerating analysts with feedback...")
             
-            graph.update_state(
-                config,
-                {"human_analyst_feedback": feedback_text}
-            )
-            
-            # Continue execution
-            graph.invoke(None, config)
-            
-            # Get updated analysts
-            state = graph.get_state(config)
-            analysts = state.values.get("analysts", [])
+            analysts = await _regenerate(session, feedback_text)
             
-            return (
+            yield (
                 f"✅ Regenerated {len(analysts)} analysts. Please review again.",
                 "",
                 ""
             )
+            return
         
         # Approve and continue
         progress(0.5, desc="Starting interviews...")
         
-        graph.update_state(config, {"human_analyst_feedback": "approve"})
+        await graph.aupdate_state(config, {"human_analyst_feedback": "approve"})
         
         # Track progress through execution
-        start_time = time.time()
-        analysts = APP_STATE["current_research"]["analysts"]
-        num_analysts = len(analysts)
-        
-        # Continue execution with streaming updates
-        intermediate_md = "# Research Progress\n\n"
-        
-        for i, analyst in enumerate(analysts):
-            progress_val = 0.5 + (0.3 * (i / num_analysts))
-            progress(
-                progress_val,
-                desc=f"Interviewing analyst {i+1}/{num_analysts}: {analyst.name}"
-            )
-            intermediate_md += f"### Analyst {i+1}: {analyst.name}\n"
-            intermediate_md += f"Status: Conducting interview...\n\n"
-        
-        # Continue graph execution
-        progress(0.8, desc="Synthesizing final report...")
+        start_time = time.monotonic()
+        num_analysts = len(session["current_research"]["analysts"])
+        interviews_done = 0
+        
+        status = "⏳ Research in progress..."
+        progress_lines = ["# Research Progress\n\n"]
+        yield status, progress_lines[0], ""
+        last_flush = time.monotonic()
+        pending_flush = False
+        
+        # Continue graph execution, surfacing each completed node. Updates are
+        # coalesced so bursts of events produce a single UI refresh.
+        async for update in graph.astream(None, config, stream_mode="updates"):
+            for node in update:
+                if node == "conduct_interview":
+                    interviews_done += 1
+                    progress(
+                        0.5 + 0.3 * (interviews_done / num_analysts),
+                        desc=f"Interviews completed: {interviews_done}/{num_analysts}"
+                    )
+                    progress_lines.append(
+                        f"- ✅ Interview {interviews_done}/{num_analysts} completed\n"
+                    )
+                elif node == "finalize_report":
+                    progress(0.95, desc="Synthesizing final report...")
+                    progress_lines.append("- ✅ Final report assembled\n")
+                else:
+                    progress(0.8, desc="Writing report sections...")
+                    progress_lines.append(f"- ✅ {node}\n")
+            
+            pending_flush = True
+            if time.monotonic() - last_flush >= PROGRESS_FLUSH_INTERVAL:
+                yield status, "".join(progress_lines), ""
+                last_flush = time.monotonic()
+                pending_flush = False
         
-        final_state = graph.invoke(None, config)
+        intermediate_md = "".join(progress_lines)
+        if pending_flush:
+            yield status, intermediate_md, ""
         
         # Extract results
-        final_report = final_state.get("final_report", "")
+        final_state = await graph.aget_state(config)
+        final_report = final_state.values.get("final_report", "")
         
         if not final_report:
-            return (
+            yield (
                 "❌ Error: Failed to generate final report",
                 intermediate_md,
                 ""
             )
+            return
         
         # Get metrics
         metrics = get_metrics()
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
         
         # Update intermediate results
-        intermediate_md += f"\n### Research Completed\n\n"
-        intermediate_md += f"- **Duration:** {format_duration(duration)}\n"
-        intermediate_md += f"- **API Calls:** {metrics.get('api_calls', 0)}\n"
-        intermediate_md += f"- **Tokens Used:** {metrics.get('total_tokens', 0):,}\n"
+        intermediate_md = "".join([
+            intermediate_md,
+            "\n### Research Completed\n\n",
+            f"- **Duration:** {format_duration(duration)}\n",
+            f"- **API Calls:** {metrics.get('api_calls', 0)}\n",
+            f"- **Tokens Used:** {metrics.get('total_tokens', 0):,}\n",
+        ])
         
         progress(1.0, desc="Complete!")
         
         logger.info(f"Research completed in {format_duration(duration)}")
         
-        return (
+        yield (
             "✅ Research complete! Download your report below.",
             intermediate_md,
             final_report
@@ -348,58 +533,72 @@ def approve_analysts(
         
     except Exception as e:
         logger.error(f"Error during research: {e}", exc_info=True)
-        return (
+        yield (
             f"❌ Error: {str(e)}",
             "",
             ""
         )
 
 
-def regenerate_analysts(
+async def regenerate_analysts(
+    session: dict,
     feedback: str,
     progress=gr.Progress()
-) -> Tuple[str, str]:
+) -> Tuple[str, str, dict]:
     """Regenerate analysts with feedback.
     
     Args:
+        session: Per-user session state (thread ID and current research).
         feedback: Feedback for regeneration.
         progress: Gradio progress tracker.
         
     Returns:
-        Tuple of (status, analysts_display).
+        Tuple of (status, analysts_display, session).
     """
     try:
         if not feedback or feedback.strip().lower() == "approve":
             return (
                 "⚠️ Please provide specific feedback for regeneration.",
-                ""
+                "",
+                session
+            )
+        
+        if session.get("thread_id") is None:
+            return (
+                "❌ Error: No active research. Please start research first.",
+                "",
+                session
             )
         
         progress(0.3, desc="Regenerating analysts...")
         
-        # Update with feedback and regenerate
-        status, analysts_md, _, error = start_research(
-            topic=APP_STATE["current_research"]["topic"],
-            max_analysts=len(APP_STATE["current_research"]["analysts"]),
-            max_turns=2,
-            detailed_prompts=False,
-            progress=progress
-        )
+        # Resume the paused run with the feedback
+        analysts = await _regenerate(session, feedback.strip())
         
-        return status, analysts_md
+        progress(0.5, desc="Awaiting analyst approval...")
+        
+        return (
+            f"✅ Regenerated {len(analysts)} analysts. Please review again.",
+            format_analysts_markdown(analysts),
+            session
+        )
         
     except Exception as e:
         logger.error(f"Error regenerating analysts: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}", ""
+        return f"❌ Error: {str(e)}", "", session
 
 
 # ============================================================================
 # UI Components
 # ============================================================================
 
-def create_interface() -> gr.Blocks:
+def create_interface(llm_concurrency_limit: int = 5) -> gr.Blocks:
     """Create the Gradio interface.
     
+    Args:
+        llm_concurrency_limit: Maximum number of LLM-heavy callbacks (start,
+            approve, regenerate) running at once across all sessions.
+    
     Returns:
         Gradio Blocks interface.
     """
@@ -556,10 +755,16 @@ def create_interface() -> gr.Blocks:
                 )
 
         
+        # Per-session research state (thread ID, current analysts)
+        session_state = gr.State({})
+        
         # Event handlers
         start_btn.click(
             fn=start_research,
+            concurrency_limit=llm_concurrency_limit,
+            concurrency_id="llm",
             inputs=[
+                session_state,
                 topic_input,
                 max_analysts_input,
                 max_turns_input,
@@ -569,13 +774,16 @@ def create_interface() -> gr.Blocks:
                 status_output,
                 analysts_display,
                 intermediate_results,
-                gr.Textbox(visible=False)  # error output
+                gr.Textbox(visible=False),  # error output
+                session_state
             ]
         )
         
         approve_btn.click(
             fn=approve_analysts,
-            inputs=[feedback_input],
+            concurrency_limit=llm_concurrency_limit,
+            concurrency_id="llm",
+            inputs=[session_state, feedback_input],
             outputs=[
                 status_output,
                 intermediate_results,
@@ -585,17 +793,22 @@ def create_interface() -> gr.Blocks:
         
         regenerate_btn.click(
             fn=regenerate_analysts,
-            inputs=[feedback_input],
+            concurrency_limit=llm_concurrency_limit,
+            concurrency_id="llm",
+            inputs=[session_state, feedback_input],
             outputs=[
                 status_output,
-                analysts_display
+                analysts_display,
+                session_state
             ]
         )
         
-        def save_report_to_file(report_text: str) -> Optional[str]:
-            """Save report as PDF for download."""
-            if not report_text:
-                return None
+        def build_report_pdf(report_text: str) -> str:
+            """Render the report to a timestamped PDF and return its path."""
+            # Deferred so reportlab is only loaded once a report is saved
+            from reportlab.lib.pagesizes import A4
+            from reportlab.lib.styles import getSampleStyleSheet
+            from reportlab.platypus import Paragraph, SimpleDocTemplate
 
             output_dir = Path("outputs")
             output_dir.mkdir(exist_ok=True)
@@ -616,6 +829,17 @@ def create_interface() -> gr.Blocks:
             logger.info(f"📄 PDF report saved to: {pdf_path.resolve()}")
 
             return str(pdf_path.resolve())
+
+        async def save_report_to_file(report_text: str) -> Optional[str]:
+            """Save report as PDF for download.
+            
+            PDF rendering and the disk write run in a worker thread so large
+            reports do not stall the event loop for other sessions.
+            """
+            if not report_text:
+                return None
+
+            return await asyncio.to_thread(build_report_pdf, report_text)
         
         download_btn.click(
             fn=save_report_to_file,
@@ -651,9 +875,8 @@ def main():
 
     # Initialize graph on startup
     try:
-        # Load Hydra configs
-        load_env_file()
-        cfg = load_config()
+        # Load .env and Hydra configs
+        cfg = bootstrap()
 
         # Validate required environment variables
         if not check_required_env_vars(cfg):
@@ -668,7 +891,15 @@ def main():
         return
     
     # Create and launch interface
-    interface = create_interface()
+    interface = create_interface(
+        llm_concurrency_limit=cfg.app.gradio.get("llm_concurrency_limit", 5)
+    )
+
+    # Queue requests so concurrent sessions are scheduled on the event loop
+    interface.queue(
+        default_concurrency_limit=cfg.app.gradio.get("concurrency_limit", 10),
+        max_size=cfg.app.gradio.get("max_queue_size", 50),
+    )
 
     # Launch using config parameters    
     interface.launch(
@@ -8,11 +8,13 @@ Reads configuration from coverage.toml.
 
 import json
 import logging
-import subprocess
+import re
 import sys
 import tomllib  # Python 3.11+
 from pathlib import Path
 
+import coverage
+
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 
@@ -27,46 +29,70 @@ def load_thresholds():
     return cfg.get("coverage_thresholds", {})
 
 
+def compile_thresholds(thresholds):
+    """Compile threshold patterns into a single regex alternation.
+
+    The alternation sits inside a lookahead so that matches may overlap and
+    every position reports its longest pattern; see ``longest_match``.
+    """
+    patterns = sorted(thresholds, key=len, reverse=True)
+    return re.compile("(?=(" + "|".join(map(re.escape, patterns)) + "))")
+
+
+def longest_match(matcher, rel_path):
+    """Return the longest threshold pattern contained in rel_path, or None."""
+    return max((m.group(1) for m in matcher.finditer(rel_path)), key=len, default=None)
+
+
+def module_coverage():
+    """Compute percent covered per measured file from the .coverage data.
+
+    Writes the public JSON report in-process, so with ``branch = true`` the
+    percentages include branch coverage.
+    """
+    cov = coverage.Coverage(config_file=str(CONFIG_PATH))
+    cov.load()
+
+    try:
+        # ignore_errors mirrors `coverage json -i`: skip files that can't be parsed
+        cov.json_report(outfile=str(COVERAGE_JSON), ignore_errors=True)
+    except coverage.CoverageException as e:
+        logger.error(str(e))
+        return {}
+
+    data = json.loads(COVERAGE_JSON.read_text())
+    return {
+        file: summary["summary"]["percent_covered"] for file, summary in data["files"].items()
+    }
+
+
 def main():
-    # Generate JSON coverage report, using coverage.toml explicitly
-    result = subprocess.run(
-        [
-            "coverage",
-            "json",
-            "-q",
-            "-i",  # ignore parse errors like couldn't-parse
-            "--rcfile",
-            str(CONFIG_PATH),
-            "-o",
-            str(COVERAGE_JSON),
-        ],
-        capture_output=True,
-        text=True,
-    )
-
-    if result.returncode != 0:
-        logger.warning("⚠️  Warning: coverage json returned non-zero exit code.")
-        if result.stderr:
-            logger.error(result.stderr.strip())
-
-    if not COVERAGE_JSON.exists():
-        logger.warning("coverage.json was not generated.")
+    # Analyze coverage data in-process, using coverage.toml explicitly
+    data = module_coverage()
+
+    if not data:
+        logger.warning("No coverage data found.")
         logger.info("Make sure coverage.toml is valid and that pytest wrote .coverage data.")
         sys.exit(1)
 
-    data = json.loads(COVERAGE_JSON.read_text())
     thresholds = load_thresholds()
+    if not thresholds:
+        logger.info("No coverage thresholds configured.")
+        return
+    matcher = compile_thresholds(thresholds)
     failures = []
 
-    for file, summary in data["files"].items():
-        if not file.startswith("src/research_assistant/"):
+    for file, cov in data.items():
+        file = Path(file).as_posix()
+        if "src/research_assistant/" not in file:
             continue
         rel_path = file.split("src/research_assistant/")[1]
-        cov = summary["summary"]["percent_covered"]
-        for pattern, threshold in thresholds.items():
-            if pattern in rel_path and cov < threshold:
-                failures.append((rel_path, cov, threshold))
-                break
+        pattern = longest_match(matcher, rel_path)
+        if pattern is None:
+            continue
+        threshold = thresholds[pattern]
+        if cov < threshold:
+            failures.append((rel_path, cov, threshold))
 
     if failures:
         logger.warning("\nCoverage threshold violations:\n")
@@ -0,0 +1,19 @@
+"""Caching layers for expensive LLM calls."""
+
+from .llm_cache import (
+    LLMCache,
+    acached_invoke,
+    cache_key,
+    cached_invoke,
+    get_llm_cache,
+    set_llm_cache,
+)
+
+__all__ = [
+    "LLMCache",
+    "acached_invoke",
+    "cache_key",
+    "cached_invoke",
+    "get_llm_cache",
+    "set_llm_cache",
+]
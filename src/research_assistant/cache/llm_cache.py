@@ -0,0 +1,309 @@
+"""Response cache for deterministic LLM calls.
+
+This module provides an exact-match cache for chat model responses. Entries
+are keyed on the model name, the rendered message list, the sampling
+temperature, and any bound tools, so identical prompts (e.g. re-running an
+example topic) are answered without another API round trip. Calls made with
+a non-zero temperature are never cached.
+
+The cache is opt-in: nodes consult the process-wide cache installed with
+``set_llm_cache`` and fall through to the model when none is configured.
+
+Example:
+    >>> from research_assistant.cache import LLMCache, set_llm_cache
+    >>> set_llm_cache(LLMCache(max_size=256, ttl_seconds=3600))
+    >>> # Subsequent node invocations with identical prompts hit the cache
+"""
+
+import hashlib
+import json
+import logging
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def _unwrap_chat_model(llm: Any) -> tuple[Any, dict[str, Any]]:
+    """Find the underlying chat model and any bound kwargs (tools, schemas).
+
+    Structured-output runnables wrap the chat model in a sequence of
+    bindings; walk ``first``/``bound`` until the model itself is reached.
+
+    Args:
+        llm: Chat model or runnable wrapping one.
+
+    Returns:
+        Tuple of (chat model, merged binding kwargs).
+    """
+    bound_kwargs: dict[str, Any] = {}
+    model = llm
+
+    for _ in range(5):
+        if hasattr(model, "first") and not hasattr(model, "model_name"):
+            model = model.first
+        elif hasattr(model, "bound") and hasattr(model, "kwargs"):
+            if isinstance(model.kwargs, dict):
+                bound_kwargs.update(model.kwargs)
+            model = model.bound
+        else:
+            break
+
+    return model, bound_kwargs
+
+
+def _serialize_message(message: Any) -> dict[str, Any]:
+    """Render a chat message into a stable, hashable representation."""
+    return {
+        "type": getattr(message, "type", type(message).__name__),
+        "name": getattr(message, "name", None),
+        "content": getattr(message, "content", str(message)),
+    }
+
+
+def cache_key(
+    model: str, messages: list[Any], temperature: float | None, tools: Any = None
+) -> str | None:
+    """Build the cache key for an LLM call.
+
+    Args:
+        model: Model name.
+        messages: Messages sent to the model.
+        temperature: Sampling temperature used for the call.
+        tools: Bound tools or structured-output schema, if any.
+
+    Returns:
+        SHA-256 hex digest, or None if the call is not cacheable
+        (non-deterministic sampling).
+    """
+    if temperature is None or temperature > 0:
+        return None
+
+    payload = {
+        "model": model,
+        "messages": [_serialize_message(m) for m in messages],
+        "temperature": temperature,
+        "tools": tools,
+    }
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+class LLMCache:
+    """Exact-match LRU cache for LLM responses with TTL expiry.
+
+    Entries live in memory; when ``db_path`` is given they are also written
+    to a SQLite table so the cache survives process restarts.
+
+    Attributes:
+        max_size: Maximum number of in-memory entries.
+        ttl_seconds: Time-to-live for each entry.
+
+    Example:
+        >>> cache = LLMCache(max_size=128, db_path=".cache/llm.sqlite")
+        >>> key = cache_key("gpt-4o", messages, 0.0)
+        >>> cache.set(key, response)
+        >>> cache.get(key)
+    """
+
+    def __init__(
+        self, max_size: int = 256, ttl_seconds: int = 3600, db_path: str | None = None
+    ) -> None:
+        """Initialize LLM cache.
+
+        Args:
+            max_size: Maximum number of in-memory entries.
+            ttl_seconds: Time-to-live for each entry in seconds.
+            db_path: Optional SQLite file for persistent storage.
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        self._db: sqlite3.Connection | None = None
+        if db_path is not None:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache "
+                "(key TEXT PRIMARY KEY, created REAL, value BLOB)"
+            )
+            self._db.commit()
+
+        logger.debug(f"Initialized LLM cache with max_size={max_size}, ttl={ttl_seconds}s")
+
+    def _is_expired(self, created: float) -> bool:
+        return time.time() - created > self.ttl_seconds
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached response for a key, or None on miss/expiry.
+
+        Args:
+            key: Cache key from ``cache_key``.
+
+        Returns:
+            Cached response, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None and self._db is not None:
+                row = self._db.execute(
+                    "SELECT created, value FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    entry = (row[0], pickle.loads(row[1]))
+                    self._entries[key] = entry
+
+            if entry is None or self._is_expired(entry[0]):
+                if entry is not None:
+                    self._evict(key)
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            logger.debug(f"LLM cache hit: {key[:12]}")
+            return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a response under a key, evicting the least recently used entry.
+
+        Args:
+            key: Cache key from ``cache_key``.
+            value: Response to cache.
+        """
+        created = time.time()
+        with self._lock:
+            self._entries[key] = (created, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?)",
+                    (key, created, pickle.dumps(value)),
+                )
+                self._db.commit()
+
+    def _evict(self, key: str) -> None:
+        self._entries.pop(key, None)
+        if self._db is not None:
+            self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            self._db.commit()
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM llm_cache")
+                self._db.commit()
+        logger.info("LLM cache cleared")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with entry count and hit/miss counters.
+        """
+        return {
+            "entries": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+
+_llm_cache: LLMCache | None = None
+
+
+def set_llm_cache(cache: LLMCache | None) -> None:
+    """Install (or remove, with None) the process-wide LLM cache.
+
+    Args:
+        cache: Cache instance to use for node LLM calls.
+    """
+    global _llm_cache
+    _llm_cache = cache
+
+
+def get_llm_cache() -> LLMCache | None:
+    """Return the process-wide LLM cache, if one is configured."""
+    return _llm_cache
+
+
+def _call_key(cache: LLMCache | None, llm: Any, messages: list[Any]) -> str | None:
+    """Return the cache key for a call, or None if it should bypass the cache."""
+    if cache is None:
+        return None
+
+    model, bound_kwargs = _unwrap_chat_model(llm)
+    model_name = getattr(model, "model_name", None) or getattr(model, "model", None)
+    temperature = getattr(model, "temperature", None)
+
+    if isinstance(model_name, str) and isinstance(temperature, int | float):
+        return cache_key(model_name, messages, float(temperature), bound_kwargs or None)
+
+    return None
+
+
+def cached_invoke(llm: Any, messages: list[Any]) -> Any:
+    """Invoke an LLM, serving deterministic calls from the configured cache.
+
+    Args:
+        llm: Chat model or runnable wrapping one.
+        messages: Messages to send.
+
+    Returns:
+        Model response (possibly from cache).
+    """
+    cache = _llm_cache
+    key = _call_key(cache, llm, messages)
+
+    if cache is None or key is None:
+        return llm.invoke(messages)
+
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    response = llm.invoke(messages)
+    cache.set(key, response)
+    return response
+
+
+async def acached_invoke(llm: Any, messages: list[Any]) -> Any:
+    """Async variant of cached_invoke, using ``llm.ainvoke`` on a miss.
+
+    Args:
+        llm: Chat model or runnable wrapping one.
+        messages: Messages to send.
+
+    Returns:
+        Model response (possibly from cache).
+    """
+    cache = _llm_cache
+    key = _call_key(cache, llm, messages)
+
+    if cache is None or key is None:
+        return await llm.ainvoke(messages)
+
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    response = await llm.ainvoke(messages)
+    cache.set(key, response)
+    return response
@@ -12,7 +12,9 @@ Example:
 
 from .config import (
     ConfigPaths,
+    bootstrap,
     check_required_env_vars,
+    clear_config_cache,
     create_development_config,
     create_production_config,
     create_quick_research_config,
@@ -34,6 +36,7 @@ __all__ = [
     # Core loading functions
     "load_config",
     "load_config_from_file",
+    "clear_config_cache",
     "save_config",
     "merge_configs",
     # Component-specific extractors
@@ -46,6 +49,7 @@ __all__ = [
     "validate_config",
     "print_config",
     "load_env_file",
+    "bootstrap",
     "check_required_env_vars",
     # Templates
     "create_quick_research_config",
@@ -9,20 +9,28 @@ Example:
     >>> llm_config = get_llm_config(cfg)
 """
 
+from __future__ import annotations
+
+import copy
 import logging
 import os
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, cast
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, cast
 
-from hydra import compose, initialize_config_dir
-from hydra.core.global_hydra import GlobalHydra
-from omegaconf import DictConfig, OmegaConf
+# Hydra/OmegaConf are imported where used so that importing this module
+# (e.g. for ConfigPaths or load_env_file) doesn't pay their import cost.
+if TYPE_CHECKING:
+    from omegaconf import DictConfig
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConfigPaths:
     """Configuration file paths."""
 
@@ -33,28 +41,16 @@ class ConfigPaths:
     search_dir: Path
 
     @classmethod
-    def from_package(cls) -> "ConfigPaths":
+    def from_package(cls) -> ConfigPaths:
         """Create ConfigPaths from package structure.
 
+        The paths are resolved on first call and the same instance is
+        returned afterwards.
+
         Returns:
             ConfigPaths instance with standard paths.
         """
-        # Get the directory containing this config.py file (the config directory itself)
-        config_dir = Path(__file__).parent.resolve()
-
-        # Root is the package root (go up two levels: config -> research_assistant -> src)
-        root = config_dir.parent.parent.parent
-
-        logger.debug(f"Resolved config directory: {config_dir}")
-        logger.debug(f"Resolved root directory: {root}")
-
-        return cls(
-            root=root,
-            config_dir=config_dir,
-            default=config_dir / "default.yaml",
-            llm_dir=config_dir / "llm",
-            search_dir=config_dir / "search",
-        )
+        return _package_config_paths()
 
     def validate(self) -> bool:
         """Validate that config directories exist.
@@ -62,16 +58,82 @@ class ConfigPaths:
         Returns:
             True if all paths exist, False otherwise.
         """
-        paths_to_check = [self.config_dir, self.default, self.llm_dir, self.search_dir]
+        try:
+            # One directory listing instead of a stat per path
+            with os.scandir(self.config_dir) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            logger.warning(f"Config path does not exist: {self.config_dir}")
+            return False
 
-        for path in paths_to_check:
-            if not path.exists():
-                logger.warning(f"Config path does not exist: {path}")
-                return False
+        missing = [
+            path
+            for path in (self.default, self.llm_dir, self.search_dir)
+            if not (path.name in names if path.parent == self.config_dir else path.exists())
+        ]
+
+        if missing:
+            logger.warning(f"Config paths do not exist: {[str(p) for p in missing]}")
+            return False
 
         return True
 
 
+# Directory containing this config.py file (the config directory itself)
+_CONFIG_DIR = os.path.dirname(os.path.realpath(__file__))
+
+# Root is the package root (go up three levels: config -> research_assistant -> src)
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(_CONFIG_DIR)))
+
+
+@lru_cache(maxsize=1)
+def _package_config_paths() -> ConfigPaths:
+    """Build the package config paths once per process."""
+    logger.debug(f"Resolved config directory: {_CONFIG_DIR}")
+    logger.debug(f"Resolved root directory: {_ROOT_DIR}")
+
+    return ConfigPaths(
+        root=Path(_ROOT_DIR),
+        config_dir=Path(_CONFIG_DIR),
+        default=Path(_CONFIG_DIR, "default.yaml"),
+        llm_dir=Path(_CONFIG_DIR, "llm"),
+        search_dir=Path(_CONFIG_DIR, "search"),
+    )
+
+
+# Config directory Hydra is currently initialized with by this module
+_hydra_initialized_for: str | None = None
+
+
+@lru_cache(maxsize=32)
+def _compose_cached(
+    config_name: str, overrides: tuple[str, ...], config_path: str
+) -> DictConfig:
+    """Compose a configuration with Hydra, memoized per argument set.
+
+    Callers must not mutate the returned object; ``load_config`` hands out
+    copies.
+    """
+    global _hydra_initialized_for
+
+    from hydra import compose, initialize_config_dir
+    from hydra.core.global_hydra import GlobalHydra
+
+    # Re-initialize only when the config directory changed or something else
+    # (e.g. a test) cleared Hydra in the meantime
+    hydra = GlobalHydra.instance()
+    if _hydra_initialized_for != config_path or not hydra.is_initialized():
+        # Clear any existing Hydra instance
+        hydra.clear()
+
+        # Initialize Hydra with absolute config directory path
+        initialize_config_dir(config_dir=config_path, version_base=None)
+        _hydra_initialized_for = config_path
+
+    # Compose configuration with overrides
+    return compose(config_name=config_name, overrides=list(overrides))
+
+
 def load_config(
     config_name: str = "default",
     overrides: list[str] | None = None,
@@ -79,6 +141,10 @@ def load_config(
 ) -> DictConfig:
     """Load configuration using Hydra.
 
+    Composed configurations are cached in-process per
+    ``(config_name, overrides, config_path)``; call
+    ``clear_config_cache()`` to pick up edits to the YAML files.
+
     Args:
         config_name: Name of the config file (without .yaml).
         overrides: List of override strings (e.g., ["llm=anthropic", "research.max_analysts=5"]).
@@ -96,19 +162,15 @@ def load_config(
     """
     logger.info(f"Loading configuration: {config_name}")
 
-    # Clear any existing Hydra instance
-    GlobalHydra.instance().clear()
-
     # Determine config path
     if config_path is None:
         # Get absolute path to the installed config directory
-        config_dir = Path(__file__).parent.resolve()
-        config_path = str(config_dir)
+        config_path = _CONFIG_DIR
     else:
         # Ensure provided path is absolute
         config_path = str(Path(config_path).resolve())
 
-    logger.debug(f"Config path: {config_path}")
+    logger.debug("Config path: %s", config_path)
 
     # Verify config directory exists
     if not Path(config_path).exists():
@@ -120,22 +182,33 @@ def load_config(
         raise RuntimeError(f"Config file does not exist: {config_file}")
 
     try:
-        # Initialize Hydra with absolute config directory path
-        initialize_config_dir(config_dir=config_path, version_base=None)
-
-        # Compose configuration with overrides
-        cfg = compose(config_name=config_name, overrides=overrides or [])
+        # Compose once per argument set; each caller gets its own copy
+        cfg = copy.deepcopy(_compose_cached(config_name, tuple(overrides or ()), config_path))
 
         logger.info("Configuration loaded successfully")
-        logger.debug(f"Config keys: {list(cfg.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Config keys: %s", list(cfg.keys()))
 
         return cfg
 
     except Exception as e:
-        logger.error(f"Failed to load configuration: {str(e)}", exc_info=True)
+        # The error is re-raised with its cause; only log the traceback when debugging
+        logger.error(
+            "Failed to load configuration: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG)
+        )
         raise RuntimeError(f"Configuration loading failed: {str(e)}") from e
 
 
+def clear_config_cache() -> None:
+    """Discard configurations cached by ``load_config``.
+
+    Example:
+        >>> clear_config_cache()
+        >>> cfg = load_config()  # Recomposed from the YAML files
+    """
+    _compose_cached.cache_clear()
+
+
 def load_config_from_file(file_path: str) -> DictConfig:
     """Load configuration from a specific YAML file.
 
@@ -150,13 +223,17 @@ def load_config_from_file(file_path: str) -> DictConfig:
     """
     logger.info(f"Loading configuration from file: {file_path}")
 
+    from omegaconf import OmegaConf
+
     try:
+        # OmegaConf's own loader parses 1e-5 style floats and rejects duplicate
+        # keys, which plain yaml.CSafeLoader does not
         cfg = OmegaConf.load(file_path)
         logger.info("Configuration loaded from file successfully")
         # OmegaConf.load can return DictConfig or ListConfig, we expect DictConfig
-        return cast(DictConfig, cfg)
+        return cast("DictConfig", cfg)
     except Exception as e:
-        logger.error(f"Failed to load config from file: {str(e)}")
+        logger.error("Failed to load config from file: %s", e)
         raise
 
 
@@ -170,139 +247,223 @@ def save_config(cfg: DictConfig, output_path: str) -> None:
     Example:
         >>> save_config(cfg, "./saved_config.yaml")
     """
+    import yaml
+    from omegaconf import OmegaConf
+
     logger.info(f"Saving configuration to: {output_path}")
 
     try:
-        # Convert to container and save
-        OmegaConf.save(cfg, output_path)
+        # Prefer the libyaml-backed emitter when PyYAML was built with it
+        c_safe_dumper = getattr(yaml, "CSafeDumper", None)
+        if c_safe_dumper is not None:
+            # Convert to container and save
+            data = OmegaConf.to_container(cfg, resolve=False)
+            with open(output_path, "wb", buffering=1 << 20) as f:
+                yaml.dump(
+                    data,
+                    f,
+                    Dumper=c_safe_dumper,
+                    default_flow_style=False,
+                    sort_keys=False,
+                    allow_unicode=True,
+                    encoding="utf-8",
+                )
+        else:
+            OmegaConf.save(cfg, output_path)
         logger.info("Configuration saved successfully")
     except Exception as e:
-        logger.error(f"Failed to save configuration: {str(e)}")
+        logger.error("Failed to save configuration: %s", e)
         raise
 
 
-def merge_configs(base_cfg: DictConfig, override_cfg: DictConfig) -> DictConfig:
+def merge_configs(
+    base_cfg: DictConfig, override_cfg: DictConfig, *, in_place: bool = False
+) -> DictConfig:
     """Merge two configurations with override taking precedence.
 
     Args:
         base_cfg: Base configuration.
         override_cfg: Override configuration.
+        in_place: If True, merge into ``base_cfg`` without copying it first.
+            Use only when the caller no longer needs the original base.
 
     Returns:
         Merged configuration.
 
     Example:
         >>> merged = merge_configs(default_cfg, custom_cfg)
+        >>> merged = merge_configs(load_config(), custom_cfg, in_place=True)
     """
+    from omegaconf import OmegaConf
+
     logger.debug("Merging configurations")
+
+    if in_place:
+        return cast("DictConfig", OmegaConf.unsafe_merge(base_cfg, override_cfg))
+
     # OmegaConf.merge can return DictConfig or ListConfig, we expect DictConfig
-    return cast(DictConfig, OmegaConf.merge(base_cfg, override_cfg))
+    return cast("DictConfig", OmegaConf.merge(base_cfg, override_cfg))
 
 
 # Configuration accessors for specific components
 
+# Default API key environment variables per provider
+_LLM_KEY_ENV = {"openai": "OPENAI_API_KEY", "anthropic": "ANTHROPIC_API_KEY"}
+_SEARCH_KEY_ENV = {"tavily": "TAVILY_API_KEY"}
+
+def _freeze(value: Any) -> Any:
+    """Recursively wrap dicts in read-only views and lists in tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _has_interpolations(value: Any) -> bool:
+    """Check whether an unresolved container holds any ``${...}`` references.
+
+    Args:
+        value: Container from ``OmegaConf.to_container(..., resolve=False)``.
+
+    Returns:
+        True if any string value contains an interpolation.
+    """
+    if isinstance(value, str):
+        return "${" in value
+    if isinstance(value, dict):
+        return any(_has_interpolations(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_has_interpolations(v) for v in value)
+    return False
 
-def get_llm_config(cfg: DictConfig) -> dict[str, Any]:
+
+def _to_container(section: DictConfig) -> dict[str, Any]:
+    """Convert a config section to a plain dict, resolving interpolations if present.
+
+    Args:
+        section: Config section (e.g. ``cfg.llm``) or a full config.
+
+    Returns:
+        Resolved container.
+    """
+    from omegaconf import OmegaConf
+
+    # OmegaConf.to_container returns a union type; cast to dict for type safety
+    container = cast(dict[str, Any], OmegaConf.to_container(section, resolve=False))
+    if _has_interpolations(container):
+        # Only pay for interpolation resolution when the section uses it
+        container = cast(dict[str, Any], OmegaConf.to_container(section, resolve=True))
+    return container
+
+
+def _frozen_section(section: DictConfig) -> Mapping[str, Any]:
+    """Return a read-only view of the current values of a config section.
+
+    Args:
+        section: Config section (e.g. ``cfg.llm``).
+
+    Returns:
+        Read-only mapping; nested mappings are read-only and lists are tuples.
+    """
+    return cast(Mapping[str, Any], _freeze(_to_container(section)))
+
+
+def get_llm_config(cfg: DictConfig) -> Mapping[str, Any]:
     """Extract LLM configuration.
 
     Args:
         cfg: Full configuration object.
 
     Returns:
-        Dictionary with LLM settings.
+        Read-only mapping with LLM settings.
 
     Example:
         >>> llm_cfg = get_llm_config(cfg)
         >>> logger.info(llm_cfg['model'])
     """
-    # OmegaConf.to_container returns a union type; cast to dict for type safety
-    llm_cfg = cast(dict[str, Any], OmegaConf.to_container(cfg.llm, resolve=True))
+    llm_cfg = _frozen_section(cfg.llm)
 
     # Load API key from environment
-    if "openai" in llm_cfg:
-        openai_cfg = cast(dict[str, Any], llm_cfg["openai"])
-        api_key_env = openai_cfg.get("api_key_env", "OPENAI_API_KEY")
-        llm_cfg["api_key"] = os.getenv(api_key_env)
-    elif "anthropic" in llm_cfg:
-        anthropic_cfg = cast(dict[str, Any], llm_cfg["anthropic"])
-        api_key_env = anthropic_cfg.get("api_key_env", "ANTHROPIC_API_KEY")
-        llm_cfg["api_key"] = os.getenv(api_key_env)
+    provider = next((p for p in _LLM_KEY_ENV if p in llm_cfg), None)
+    if provider is not None:
+        api_key_env = llm_cfg[provider].get("api_key_env", _LLM_KEY_ENV[provider])
+        return MappingProxyType({**llm_cfg, "api_key": os.environ.get(api_key_env)})
 
     return llm_cfg
 
 
-def get_search_config(cfg: DictConfig) -> dict[str, Any]:
+def get_search_config(cfg: DictConfig) -> Mapping[str, Any]:
     """Extract search configuration.
 
     Args:
         cfg: Full configuration object.
 
     Returns:
-        Dictionary with search settings.
+        Read-only mapping with search settings.
 
     Example:
         >>> search_cfg = get_search_config(cfg)
         >>> logger.info(search_cfg['web']['max_results'])
     """
-    # OmegaConf.to_container returns a union type; cast to dict for type safety
-    search_cfg = cast(dict[str, Any], OmegaConf.to_container(cfg.search, resolve=True))
+    search_cfg = _frozen_section(cfg.search)
 
     # Load API keys from environment
     if "web" in search_cfg and "tavily" in search_cfg["web"]:
-        web_cfg = cast(dict[str, Any], search_cfg["web"])
-        tavily_cfg = cast(dict[str, Any], web_cfg["tavily"])
-        api_key_env = tavily_cfg.get("api_key_env", "TAVILY_API_KEY")
-        web_cfg["api_key"] = os.getenv(api_key_env)
+        web_cfg = search_cfg["web"]
+        api_key_env = web_cfg["tavily"].get("api_key_env", _SEARCH_KEY_ENV["tavily"])
+        web_cfg = MappingProxyType({**web_cfg, "api_key": os.environ.get(api_key_env)})
+        return MappingProxyType({**search_cfg, "web": web_cfg})
 
     return search_cfg
 
 
-def get_research_config(cfg: DictConfig) -> dict[str, Any]:
+def get_research_config(cfg: DictConfig) -> Mapping[str, Any]:
     """Extract research configuration.
 
     Args:
         cfg: Full configuration object.
 
     Returns:
-        Dictionary with research settings.
+        Read-only mapping with research settings.
 
     Example:
         >>> research_cfg = get_research_config(cfg)
         >>> logger.info(research_cfg['max_analysts'])
     """
-    return cast(dict[str, Any], OmegaConf.to_container(cfg.research, resolve=True))
+    return _frozen_section(cfg.research)
 
 
-def get_logging_config(cfg: DictConfig) -> dict[str, Any]:
+def get_logging_config(cfg: DictConfig) -> Mapping[str, Any]:
     """Extract logging configuration.
 
     Args:
         cfg: Full configuration object.
 
     Returns:
-        Dictionary with logging settings.
+        Read-only mapping with logging settings.
 
     Example:
         >>> log_cfg = get_logging_config(cfg)
         >>> logger.info(log_cfg['level'])
     """
-    return cast(dict[str, Any], OmegaConf.to_container(cfg.logging, resolve=True))
+    return _frozen_section(cfg.logging)
 
 
-def get_output_config(cfg: DictConfig) -> dict[str, Any]:
+def get_output_config(cfg: DictConfig) -> Mapping[str, Any]:
     """Extract output configuration.
 
     Args:
         cfg: Full configuration object.
 
     Returns:
-        Dictionary with output settings.
+        Read-only mapping with output settings.
 
     Example:
         >>> output_cfg = get_output_config(cfg)
         >>> logger.info(output_cfg['output_dir'])
     """
-    return cast(dict[str, Any], OmegaConf.to_container(cfg.output, resolve=True))
+    return _frozen_section(cfg.output)
 
 
 # Validation functions
@@ -325,27 +486,32 @@ def validate_config(cfg: DictConfig) -> bool:
 
     required_sections = ["llm", "search", "research", "logging", "output"]
 
+    # Validate against a plain-dict snapshot rather than DictConfig lookups
+    c = _to_container(cfg)
+
     for section in required_sections:
-        if section not in cfg:
+        if section not in c:
             logger.error(f"Missing required config section: {section}")
             return False
 
     # Validate LLM config
-    if not cfg.llm.get("model"):
+    if not c["llm"].get("model"):
         logger.error("LLM model not specified")
         return False
 
     # Validate research config
-    if cfg.research.max_analysts < 1 or cfg.research.max_analysts > 10:
+    research = c["research"]
+    if not 1 <= research["max_analysts"] <= 10:
         logger.error("max_analysts must be between 1 and 10")
         return False
 
-    if cfg.research.max_interview_turns < 1:
+    if research["max_interview_turns"] < 1:
         logger.error("max_interview_turns must be at least 1")
         return False
 
     # Validate search config
-    if cfg.search.web.enabled and not cfg.search.web.max_results:
+    web = c["search"]["web"]
+    if web["enabled"] and not web["max_results"]:
         logger.error("web search enabled but max_results not specified")
         return False
 
@@ -363,6 +529,8 @@ def print_config(cfg: DictConfig, resolve: bool = True) -> None:
     Example:
         >>> print_config(cfg)
     """
+    from omegaconf import OmegaConf
+
     logger.info("=" * 80)
     logger.info("CONFIGURATION")
     logger.info("=" * 80)
@@ -372,9 +540,20 @@ def print_config(cfg: DictConfig, resolve: bool = True) -> None:
 # Environment variable helpers
 
 
+@lru_cache(maxsize=8)
+def _parse_env_file(env_file: str, mtime_ns: int) -> dict[str, str | None]:
+    """Parse a .env file, memoized until the file's modification time changes."""
+    from dotenv import dotenv_values
+
+    return dict(dotenv_values(env_file))
+
+
 def load_env_file(env_file: str = ".env") -> None:
     """Load environment variables from .env file.
 
+    The file is parsed once per modification time; repeated calls only
+    re-apply the cached values.
+
     Args:
         env_file: Path to .env file.
 
@@ -382,14 +561,52 @@ def load_env_file(env_file: str = ".env") -> None:
         >>> load_env_file(".env")
     """
     try:
-        from dotenv import load_dotenv
+        mtime = os.stat(env_file).st_mtime_ns
+    except OSError:
+        logger.debug(f"No .env file at {env_file}, skipping")
+        return
 
-        load_dotenv(env_file)
+    try:
+        # Like load_dotenv: variables already set in the environment win
+        environ = os.environ
+        for key, value in _parse_env_file(env_file, mtime).items():
+            if value is not None and key not in environ:
+                environ[key] = value
         logger.info(f"Loaded environment variables from {env_file}")
     except ImportError:
         logger.warning("python-dotenv not installed, skipping .env file loading")
     except Exception as e:
-        logger.warning(f"Failed to load .env file: {str(e)}")
+        logger.warning("Failed to load .env file: %s", e)
+
+
+def bootstrap(
+    env_file: str = ".env",
+    config_name: str = "default",
+    overrides: list[str] | None = None,
+    config_path: str | None = None,
+) -> DictConfig:
+    """Load the .env file and compose the configuration concurrently.
+
+    Config composition doesn't resolve interpolations, so ``${oc.env:...}``
+    references still see variables from the .env file when accessed later.
+
+    Args:
+        env_file: Path to .env file.
+        config_name: Name of the config file (without .yaml).
+        overrides: List of override strings.
+        config_path: Optional custom config directory path.
+
+    Returns:
+        DictConfig object with loaded configuration.
+
+    Example:
+        >>> cfg = bootstrap()
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        env_future = executor.submit(load_env_file, env_file)
+        cfg_future = executor.submit(load_config, config_name, overrides, config_path)
+        env_future.result()
+        return cfg_future.result()
 
 
 def check_required_env_vars(cfg: DictConfig) -> bool:
@@ -406,18 +623,22 @@ def check_required_env_vars(cfg: DictConfig) -> bool:
         ...     logger.info("Missing required environment variables")
     """
     required_vars = []
+    c = _to_container(cfg)
+    web = c["search"]["web"]
 
     # Check LLM API keys
-    if cfg.llm.provider == "openai":
-        required_vars.append("OPENAI_API_KEY")
-    elif cfg.llm.provider == "anthropic":
-        required_vars.append("ANTHROPIC_API_KEY")
+    llm_key_env = _LLM_KEY_ENV.get(c["llm"]["provider"])
+    if llm_key_env:
+        required_vars.append(llm_key_env)
 
     # Check search API keys
-    if cfg.search.web.enabled and cfg.search.web.provider == "tavily":
-        required_vars.append("TAVILY_API_KEY")
+    if web["enabled"]:
+        search_key_env = _SEARCH_KEY_ENV.get(web["provider"])
+        if search_key_env:
+            required_vars.append(search_key_env)
 
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    environ = os.environ
+    missing_vars = [var for var in required_vars if not environ.get(var)]
 
     if missing_vars:
         logger.error(f"Missing required environment variables: {missing_vars}")
@@ -430,6 +651,52 @@ def check_required_env_vars(cfg: DictConfig) -> bool:
 # Configuration templates for common scenarios
 
 
+# Static template updates as (dotted key, value) pairs
+_QUICK_UPDATES: tuple[tuple[str, Any], ...] = (
+    ("research.enable_interrupts", False),  # Quick run without interrupts
+)
+
+_DEV_UPDATES: tuple[tuple[str, Any], ...] = (
+    ("dev.debug", True),
+    ("dev.verbose", True),
+    ("logging.level", "DEBUG"),
+    ("search.web.use_cache", False),  # Fresh data
+    ("research.max_analysts", 2),  # Faster execution
+    ("research.max_interview_turns", 1),
+)
+
+_PROD_UPDATES: tuple[tuple[str, Any], ...] = (
+    ("dev.debug", False),
+    ("logging.level", "INFO"),
+    ("logging.structured", True),  # JSON logging
+    ("search.web.use_cache", True),
+    ("checkpointing.enabled", True),
+    ("performance.parallel_interviews", True),
+)
+
+
+def _config_with_updates(updates: tuple[tuple[str, Any], ...]) -> DictConfig:
+    """Apply dotted-key updates to a copy of the default configuration.
+
+    The default config is composed once (see ``load_config``), so templates
+    only pay for a copy and a few key assignments.
+
+    Args:
+        updates: (dotted key, value) pairs.
+
+    Returns:
+        Updated configuration.
+    """
+    from omegaconf import OmegaConf, open_dict
+
+    cfg = load_config()
+    # Templates may set keys (e.g. dev.*) that default.yaml doesn't declare
+    with open_dict(cfg):
+        for key, value in updates:
+            OmegaConf.update(cfg, key, value, merge=True)
+    return cfg
+
+
 def create_quick_research_config(
     topic: str, max_analysts: int = 3, llm_model: str = "gpt-4o"
 ) -> DictConfig:
@@ -446,14 +713,14 @@ def create_quick_research_config(
     Example:
         >>> cfg = create_quick_research_config("AI Safety", max_analysts=4)
     """
-    overrides = [
-        f"research.topic='{topic}'",
-        f"research.max_analysts={max_analysts}",
-        f"llm.model={llm_model}",
-        "research.enable_interrupts=false",  # Quick run without interrupts
-    ]
+    updates = (
+        ("research.topic", topic),
+        ("research.max_analysts", max_analysts),
+        ("llm.model", llm_model),
+        *_QUICK_UPDATES,
+    )
 
-    return load_config(overrides=overrides)
+    return _config_with_updates(updates)
 
 
 def create_development_config() -> DictConfig:
@@ -465,16 +732,7 @@ def create_development_config() -> DictConfig:
     Example:
         >>> cfg = create_development_config()
     """
-    overrides = [
-        "dev.debug=true",
-        "dev.verbose=true",
-        "logging.level=DEBUG",
-        "search.web.use_cache=false",  # Fresh data
-        "research.max_analysts=2",  # Faster execution
-        "research.max_interview_turns=1",
-    ]
-
-    return load_config(overrides=overrides)
+    return _config_with_updates(_DEV_UPDATES)
 
 
 def create_production_config() -> DictConfig:
@@ -486,13 +744,4 @@ def create_production_config() -> DictConfig:
     Example:
         >>> cfg = create_production_config()
     """
-    overrides = [
-        "dev.debug=false",
-        "logging.level=INFO",
-        "logging.structured=true",  # JSON logging
-        "search.web.use_cache=true",
-        "checkpointing.enabled=true",
-        "performance.parallel_interviews=true",
-    ]
-
-    return load_config(overrides=overrides)
+    return _config_with_updates(_PROD_UPDATES)
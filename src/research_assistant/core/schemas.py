@@ -20,9 +20,66 @@ Example:
     Description: Focuses on alignment and safety concerns in LLMs
 """
 
-from typing import Any
-
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+import os
+import re
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Annotated, Any
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+    ValidationError,
+    field_validator,
+)
+
+# Set to force full validation in ``from_trusted`` constructors (debugging)
+STRICT_VALIDATION_ENV = "RESEARCH_ASSISTANT_STRICT_VALIDATION"
+
+
+def _skip_validation() -> bool:
+    return os.environ.get(STRICT_VALIDATION_ENV, "").lower() not in ("1", "true", "yes")
+
+
+# Runs of whitespace, collapsed to a single space in search queries
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+# JSON schema examples
+_ANALYST_EXAMPLE: dict[str, Any] = {
+    "name": "Dr. Emily Zhang",
+    "role": "Climate Scientist",
+    "affiliation": "MIT Climate Research Institute",
+    "description": (
+        "Focuses on the intersection of AI and climate modeling. "
+        "Particularly interested in how machine learning can improve "
+        "climate predictions and inform policy decisions."
+    ),
+}
+
+_PERSPECTIVES_EXAMPLE: dict[str, Any] = {
+    "analysts": [
+        {
+            "name": "Dr. Emily Zhang",
+            "role": "Climate Scientist",
+            "affiliation": "MIT Climate Research Institute",
+            "description": "Focuses on AI applications in climate modeling",
+        },
+        {
+            "name": "Prof. Michael Chen",
+            "role": "Policy Analyst",
+            "affiliation": "Georgetown University",
+            "description": "Examines policy implications of climate technology",
+        },
+    ]
+}
+
+_SEARCH_QUERY_EXAMPLE: dict[str, Any] = {"search_query": "large language models scaling laws 2024"}
 
 
 class Analyst(BaseModel):
@@ -50,55 +107,33 @@ class Analyst(BaseModel):
         'Prof. Michael Roberts (Economics Professor at Stanford University)'
     """
 
+    # Frozen so analysts can be shared between states; change one with
+    # model_copy(update=...). The validator is built on first use rather than
+    # at import
     model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "name": "Dr. Emily Zhang",
-                "role": "Climate Scientist",
-                "affiliation": "MIT Climate Research Institute",
-                "description": (
-                    "Focuses on the intersection of AI and climate modeling. "
-                    "Particularly interested in how machine learning can improve "
-                    "climate predictions and inform policy decisions."
-                ),
-            }
-        }
+        frozen=True, defer_build=True, json_schema_extra={"example": _ANALYST_EXAMPLE}
     )
 
-    affiliation: str = Field(
-        description="Primary affiliation of the analyst.",
-        min_length=2,
-        max_length=200,
-    )
-    name: str = Field(
-        description="Name of the analyst.",
-        min_length=2,
-        max_length=100,
-    )
-    role: str = Field(
-        description="Role of the analyst in the context of the topic.",
-        min_length=2,
-        max_length=150,
-    )
-    description: str = Field(
-        description="Description of the analyst focus, concerns, and motives.",
-        min_length=10,
-        max_length=1000,
+    # Stripping and length checks run in pydantic-core
+    affiliation: Annotated[
+        str, StringConstraints(strip_whitespace=True, min_length=2, max_length=200)
+    ] = Field(description="Primary affiliation of the analyst.")
+    name: Annotated[
+        str, StringConstraints(strip_whitespace=True, min_length=2, max_length=100)
+    ] = Field(description="Name of the analyst.")
+    role: Annotated[
+        str, StringConstraints(strip_whitespace=True, min_length=2, max_length=150)
+    ] = Field(description="Role of the analyst in the context of the topic.")
+    description: Annotated[
+        str,
+        StringConstraints(strip_whitespace=True, min_length=10, max_length=1000),
+    ] = Field(
+        description=(
+            "Description of the analyst focus, concerns, and motives "
+            "(at least 5 words)."
+        )
     )
 
-    @field_validator("name", "role", "affiliation", "description")
-    @classmethod
-    def strip_whitespace(cls, v: str) -> str:
-        """Remove leading and trailing whitespace from string fields.
-
-        Args:
-            v: The string value to validate.
-
-        Returns:
-            The trimmed string.
-        """
-        return v.strip()
-
     @field_validator("description")
     @classmethod
     def validate_description_content(cls, v: str) -> str:
@@ -111,14 +146,47 @@ class Analyst(BaseModel):
             The validated description.
 
         Raises:
-            ValueError: If description is too generic or lacks substance.
+            ValueError: If description has fewer than 5 words.
         """
-        # Check for minimum word count
         word_count = len(v.split())
         if word_count < 5:
             raise ValueError(f"Description must contain at least 5 words, got {word_count}")
         return v
 
+    @classmethod
+    def from_trusted(cls, data: Mapping[str, Any]) -> "Analyst":
+        """Rebuild an analyst from data that was already validated.
+
+        Skips validation; only use for data produced by a validated Analyst
+        (e.g. ``model_dump()`` output stored in a checkpoint). Set
+        ``RESEARCH_ASSISTANT_STRICT_VALIDATION=1`` to validate anyway.
+
+        Args:
+            data: Analyst fields.
+
+        Returns:
+            Analyst instance.
+
+        Example:
+            >>> analyst = Analyst.from_trusted(other_analyst.model_dump())
+        """
+        if not _skip_validation():
+            return cls(**data)
+        return cls.model_construct(**data)
+
+    def to_record(self) -> "AnalystRecord":
+        """Convert to a slotted record for compact storage.
+
+        Returns:
+            AnalystRecord with the same field values.
+        """
+        return AnalystRecord(
+            affiliation=self.affiliation,
+            name=self.name,
+            role=self.role,
+            description=self.description,
+        )
+
     @property
     def persona(self) -> str:
         """Generate a formatted persona string for prompts.
@@ -164,10 +232,39 @@ class Analyst(BaseModel):
             'Focuses on alignment and safety concerns in LLMs.'
         """
         # Return first sentence as focus area
-        description_sentences = self.description.split(".")
-        if description_sentences:
-            return description_sentences[0].strip() + "."
-        return self.description
+        return self.description.partition(".")[0].strip() + "."
+
+
+@dataclass(frozen=True, slots=True)
+class AnalystRecord:
+    """Lightweight, already-validated analyst for long-lived in-memory storage.
+
+    Holds the same fields as ``Analyst`` without pydantic's per-instance
+    overhead. Convert back with ``to_analyst()`` at API boundaries.
+
+    Example:
+        >>> record = analyst.to_record()
+        >>> record.to_analyst() == analyst
+        True
+    """
+
+    affiliation: str
+    name: str
+    role: str
+    description: str
+
+    def to_analyst(self) -> Analyst:
+        """Convert back to an Analyst without re-validating.
+
+        Returns:
+            Analyst instance.
+        """
+        return Analyst.model_construct(
+            affiliation=self.affiliation,
+            name=self.name,
+            role=self.role,
+            description=self.description,
+        )
 
 
 class Perspectives(BaseModel):
@@ -192,25 +289,9 @@ class Perspectives(BaseModel):
         2
     """
 
+    # Frozen to match Analyst; change one with model_copy(update=...)
     model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "analysts": [
-                    {
-                        "name": "Dr. Emily Zhang",
-                        "role": "Climate Scientist",
-                        "affiliation": "MIT Climate Research Institute",
-                        "description": "Focuses on AI applications in climate modeling",
-                    },
-                    {
-                        "name": "Prof. Michael Chen",
-                        "role": "Policy Analyst",
-                        "affiliation": "Georgetown University",
-                        "description": "Examines policy implications of climate technology",
-                    },
-                ]
-            }
-        }
+        frozen=True, defer_build=True, json_schema_extra={"example": _PERSPECTIVES_EXAMPLE}
     )
 
     analysts: list[Analyst] = Field(
@@ -233,35 +314,33 @@ class Perspectives(BaseModel):
         Raises:
             ValueError: If duplicate analyst names are found.
         """
-        names = [analyst.name for analyst in v]
-        if len(names) != len(set(names)):
-            duplicates = [name for name in names if names.count(name) > 1]
-            raise ValueError(f"Duplicate analyst names found: {', '.join(set(duplicates))}")
+        counts = Counter(analyst.name for analyst in v)
+        if len(counts) != len(v):
+            duplicates = [name for name, count in counts.items() if count > 1]
+            raise ValueError(f"Duplicate analyst names found: {', '.join(duplicates)}")
         return v
 
-    @field_validator("analysts")
     @classmethod
-    def validate_diverse_roles(cls, v: list[Analyst]) -> list[Analyst]:
-        """Warn if analysts have very similar roles.
+    def from_trusted(cls, data: dict[str, Any]) -> "Perspectives":
+        """Rebuild perspectives from data that was already validated.
 
-        While not enforcing strict uniqueness (as similar roles can have
-        different focuses), this validator checks for potential redundancy.
+        Skips validation of the collection and each analyst; see
+        ``Analyst.from_trusted``.
 
         Args:
-            v: List of analysts to validate.
+            data: Dictionary with an 'analysts' list of analyst dicts.
 
         Returns:
-            The validated list of analysts.
-        """
-        roles = [analyst.role for analyst in v]
-        unique_roles = set(roles)
-
-        # If more than 50% roles are duplicated, might want to diversify
-        if len(v) > 2 and len(unique_roles) / len(v) < 0.5:
-            # In production, you might want to log this warning
-            pass
+            Perspectives instance.
 
-        return v
+        Example:
+            >>> perspectives = Perspectives.from_trusted(other.model_dump())
+        """
+        if not _skip_validation():
+            return cls(**data)
+        return cls.model_construct(
+            analysts=[Analyst.model_construct(**a) for a in data["analysts"]]
+        )
 
     def get_analyst_count(self) -> int:
         """Get the total number of analysts in the collection.
@@ -288,22 +367,20 @@ class Perspectives(BaseModel):
             >>> analyst = perspectives.get_analyst_by_name("Dr. Emily Zhang")
             >>> print(analyst.role if analyst else "Not found")
         """
-        for analyst in self.analysts:
-            if analyst.name == name:
-                return analyst
-        return None
+        # At most 10 analysts, so a scan beats maintaining an index
+        return next((analyst for analyst in self.analysts if analyst.name == name), None)
 
     def get_affiliations(self) -> list[str]:
         """Get a list of all unique affiliations.
 
         Returns:
-            List of unique affiliation strings.
+            List of unique affiliation strings, in analyst order.
 
         Example:
             >>> perspectives.get_affiliations()
             ['MIT', 'Stanford University', 'OpenAI']
         """
-        return list({analyst.affiliation for analyst in self.analysts})
+        return list(dict.fromkeys(analyst.affiliation for analyst in self.analysts))
 
     def get_summary(self) -> str:
         """Generate a summary of all analysts in the collection.
@@ -317,10 +394,15 @@ class Perspectives(BaseModel):
             1. Dr. Emily Zhang - Climate Scientist at MIT
             2. Prof. John Doe - Economist at Stanford
         """
-        summary_lines = [f"Analyst Team ({self.get_analyst_count()} members):"]
-        for i, analyst in enumerate(self.analysts, 1):
-            summary_lines.append(f"{i}. {analyst.name} - {analyst.role} at {analyst.affiliation}")
-        return "\n".join(summary_lines)
+        return "\n".join(
+            [
+                f"Analyst Team ({len(self.analysts)} members):",
+                *(
+                    f"{i}. {analyst.name} - {analyst.role} at {analyst.affiliation}"
+                    for i, analyst in enumerate(self.analysts, 1)
+                ),
+            ]
+        )
 
 
 class SearchQuery(BaseModel):
@@ -340,7 +422,7 @@ class SearchQuery(BaseModel):
     """
 
     model_config = ConfigDict(
-        json_schema_extra={"example": {"search_query": "large language models scaling laws 2024"}}
+        frozen=True, defer_build=True, json_schema_extra={"example": _SEARCH_QUERY_EXAMPLE}
     )
 
     search_query: str | None = Field(
@@ -364,32 +446,10 @@ class SearchQuery(BaseModel):
             return v
 
         # Strip whitespace and normalize
-        cleaned = " ".join(v.split())
-
-        # Warn if query is very short (might be too vague)
-        if len(cleaned) < 3:
-            # In production, you might want to log this warning
-            pass
+        cleaned = _WHITESPACE_RE.sub(" ", v).strip()
 
         return cleaned if cleaned else None
 
-    @model_validator(mode="after")
-    def validate_query_structure(self) -> "SearchQuery":
-        """Validate the overall structure of the search query.
-
-        Returns:
-            The validated SearchQuery instance.
-        """
-        if self.search_query:
-            # Check for excessively long queries
-            word_count = len(self.search_query.split())
-            if word_count > 15:
-                # Long queries might not perform well
-                # In production, you might want to log this
-                pass
-
-        return self
-
     def get_word_count(self) -> int:
         """Get the number of words in the search query.
 
@@ -431,7 +491,49 @@ AnalystList = list[Analyst]
 SearchQueries = list[SearchQuery]
 
 
+@lru_cache(maxsize=1)
+def _analyst_list_adapter() -> TypeAdapter[list[Analyst]]:
+    """Validator for whole analyst lists, built once on first use."""
+    return TypeAdapter(list[Analyst])
+
+
 # Validation utilities
+def validate_analyst_list(items: list[dict[str, Any]]) -> list[Analyst]:
+    """Validate a list of analyst dictionaries in a single call.
+
+    Args:
+        items: Analyst dictionaries.
+
+    Returns:
+        List of validated Analyst instances.
+
+    Raises:
+        ValidationError: If any analyst is invalid.
+
+    Example:
+        >>> analysts = validate_analyst_list([analyst_data1, analyst_data2])
+    """
+    return _analyst_list_adapter().validate_python(items)
+
+
+def validate_analyst_list_json(data: str | bytes) -> list[Analyst]:
+    """Parse and validate a JSON array of analysts without ``json.loads``.
+
+    Args:
+        data: JSON array of analyst objects.
+
+    Returns:
+        List of validated Analyst instances.
+
+    Raises:
+        ValidationError: If the JSON is malformed or any analyst is invalid.
+
+    Example:
+        >>> analysts = validate_analyst_list_json(b'[{"name": "Dr. Smith", ...}]')
+    """
+    return _analyst_list_adapter().validate_json(data)
+
+
 def validate_analyst_diversity(analysts: list[Analyst]) -> bool:
     """Check if a list of analysts has sufficient diversity.
 
@@ -450,18 +552,15 @@ def validate_analyst_diversity(analysts: list[Analyst]) -> bool:
         >>> if not is_diverse:
         ...     print("Consider adding analysts with different perspectives")
     """
-    if len(analysts) <= 1:
+    count = len(analysts)
+    if count <= 1:
         return True
 
-    roles = {analyst.role for analyst in analysts}
-    affiliations = {analyst.affiliation for analyst in analysts}
-
-    # Good diversity: unique roles and at least some affiliation diversity
-    unique_roles_ratio = len(roles) / len(analysts)
-    unique_affiliation_ratio = len(affiliations) / len(analysts)
-
-    # At least 70% unique roles and 50% unique affiliations
-    return unique_roles_ratio >= 0.7 and unique_affiliation_ratio >= 0.5
+    # Good diversity: at least 70% unique roles and 50% unique affiliations.
+    # Compared in integers, and affiliations are only counted if roles pass.
+    if len({analyst.role for analyst in analysts}) * 10 < count * 7:
+        return False
+    return len({analyst.affiliation for analyst in analysts}) * 2 >= count
 
 
 def create_analyst_from_dict(data: dict[str, Any]) -> Analyst:
@@ -489,10 +588,13 @@ def create_analyst_from_dict(data: dict[str, Any]) -> Analyst:
         ... }
         >>> analyst = create_analyst_from_dict(analyst_data)
     """
-    required_fields = {"name", "role", "affiliation", "description"}
-    missing_fields = required_fields - set(data.keys())
-
-    if missing_fields:
-        raise ValueError(f"Missing required fields: {', '.join(missing_fields)}")
-
-    return Analyst(**data)
+    try:
+        return Analyst.model_validate(data)
+    except ValidationError as e:
+        # Only the error path pays for building the friendlier message
+        missing_fields = [
+            str(error["loc"][0]) for error in e.errors() if error["type"] == "missing"
+        ]
+        if missing_fields:
+            raise ValueError(f"Missing required fields: {', '.join(missing_fields)}") from e
+        raise
@@ -22,14 +22,16 @@ Example:
 """
 
 import operator
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Annotated, Any, TypedDict, cast
 
 from langchain_core.messages import AIMessage, HumanMessage
 from langgraph.graph import MessagesState
+from pydantic_core import from_json, to_json
 
-from .schemas import Analyst
+from .schemas import Analyst, validate_analyst_list
 
 
 class WorkflowStage(str, Enum):
@@ -37,6 +39,10 @@ class WorkflowStage(str, Enum):
 
     These stages help identify where the research process is currently
     at and enable proper state management and debugging.
+
+    Members are singletons, so compare stages with ``is`` against a member
+    (e.g. ``metadata.stage is WorkflowStage.COMPLETED``) rather than ``==``
+    against a string.
     """
 
     INITIAL = "initial"
@@ -50,6 +56,24 @@ class WorkflowStage(str, Enum):
     ERROR = "error"
 
 
+class AnalystDict(TypedDict):
+    """Plain-dict mirror of the Analyst model.
+
+    Used where analysts are stored or passed as raw data (checkpoints, API
+    payloads) so that the Pydantic model is only materialized at the edges.
+
+    Example:
+        >>> record: AnalystDict = analyst_to_dict(analyst)
+        >>> record["name"]
+        'Dr. Sarah Chen'
+    """
+
+    name: str
+    role: str
+    affiliation: str
+    description: str
+
+
 class GenerateAnalystsState(TypedDict, total=False):
     """State for the analyst generation phase.
 
@@ -91,6 +115,8 @@ class InterviewState(MessagesState, total=False):
         analyst: The Analyst conducting the interview.
         interview: Complete transcript of the interview conversation.
         sections: Final report sections generated from the interview.
+        expert_turn_count: Number of expert answers so far. Uses operator.add
+            so each answer node adds 1, which keeps turn counting O(1).
 
     Note:
         Inherits 'messages' from MessagesState for conversation history.
@@ -114,6 +140,7 @@ class InterviewState(MessagesState, total=False):
     sections: list[
         dict[str, Any]
     ]  # Assuming sections are dicts (e.g., {"title": str, "content": str})
+    expert_turn_count: Annotated[int, operator.add]
 
 
 class ResearchGraphState(TypedDict, total=False):
@@ -160,7 +187,7 @@ class ResearchGraphState(TypedDict, total=False):
     max_interview_turns: int
 
 
-@dataclass
+@dataclass(slots=True)
 class StateMetadata:
     """Metadata for tracking state evolution and debugging.
 
@@ -192,9 +219,18 @@ class StateMetadata:
     api_calls: int = 0
     custom_data: dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # Node names are compared often; interning makes equal names identical
+        if self.node_name:
+            self.node_name = sys.intern(self.node_name)
+
 
 # State Validation Functions
 
+# Keys each state type must contain
+_REQUIRED_ANALYST_STATE_FIELDS = frozenset({"topic", "max_analysts"})
+_REQUIRED_INTERVIEW_STATE_FIELDS = frozenset({"messages", "analyst"})
+
 
 def validate_generate_analysts_state(state: GenerateAnalystsState) -> bool:
     """Validate the GenerateAnalystsState structure and content.
@@ -214,34 +250,36 @@ def validate_generate_analysts_state(state: GenerateAnalystsState) -> bool:
         True
     """
     # Check required fields
-    required_fields = {"topic", "max_analysts"}
-    missing_fields = required_fields - set(state.keys())
+    missing_fields = _REQUIRED_ANALYST_STATE_FIELDS.difference(state)
     if missing_fields:
         raise ValueError(f"Missing required fields: {missing_fields}")
 
+    topic = state["topic"]
+    max_analysts = state["max_analysts"]
+
     # Validate topic
-    if not state["topic"] or not state["topic"].strip():
+    if not topic or not topic.strip():
         raise ValueError("Topic cannot be empty")
 
-    if len(state["topic"]) < 3:
+    if len(topic) < 3:
         raise ValueError("Topic must be at least 3 characters long")
 
-    # Validate max_analysts
-    if not isinstance(state["max_analysts"], int):
+    # Validate max_analysts (exact type check: bool is not a valid count)
+    if type(max_analysts) is not int:
         raise ValueError("max_analysts must be an integer")
 
-    if state["max_analysts"] < 1 or state["max_analysts"] > 10:
+    if not 1 <= max_analysts <= 10:
         raise ValueError("max_analysts must be between 1 and 10")
 
     # Validate analysts list if present
     if "analysts" in state:
-        if not isinstance(state["analysts"], list):
+        analysts = state["analysts"]
+        if not isinstance(analysts, list):
             raise ValueError("analysts must be a list")
 
-        if len(state["analysts"]) > state["max_analysts"]:
+        if len(analysts) > max_analysts:
             raise ValueError(
-                f"Number of analysts ({len(state['analysts'])}) exceeds "
-                f"max_analysts ({state['max_analysts']})"
+                f"Number of analysts ({len(analysts)}) exceeds max_analysts ({max_analysts})"
             )
 
     return True
@@ -270,8 +308,7 @@ def validate_interview_state(state: InterviewState) -> bool:
         True
     """
     # Check required fields
-    required_fields = {"messages", "analyst"}
-    missing_fields = required_fields - set(state.keys())
+    missing_fields = _REQUIRED_INTERVIEW_STATE_FIELDS.difference(state)
     if missing_fields:
         raise ValueError(f"Missing required fields: {missing_fields}")
 
@@ -285,10 +322,11 @@ def validate_interview_state(state: InterviewState) -> bool:
 
     # Validate max_num_turns if present
     if "max_num_turns" in state:
-        if not isinstance(state["max_num_turns"], int):
+        max_num_turns = state["max_num_turns"]
+        if type(max_num_turns) is not int:
             raise ValueError("max_num_turns must be an integer")
 
-        if state["max_num_turns"] < 1 or state["max_num_turns"] > 10:
+        if not 1 <= max_num_turns <= 10:
             raise ValueError("max_num_turns must be between 1 and 10")
 
     # Validate context if present
@@ -321,28 +359,31 @@ def validate_research_state(state: ResearchGraphState) -> bool:
         True
     """
     # Check required fields
-    required_fields = {"topic", "max_analysts"}
-    missing_fields = required_fields - set(state.keys())
+    missing_fields = _REQUIRED_ANALYST_STATE_FIELDS.difference(state)
     if missing_fields:
         raise ValueError(f"Missing required fields: {missing_fields}")
 
+    topic = state["topic"]
+    max_analysts = state["max_analysts"]
+
     # Validate topic
-    if not state["topic"] or not state["topic"].strip():
+    if not topic or not topic.strip():
         raise ValueError("Topic cannot be empty")
 
-    # Validate max_analysts
-    if not isinstance(state["max_analysts"], int):
+    # Validate max_analysts (exact type check: bool is not a valid count)
+    if type(max_analysts) is not int:
         raise ValueError("max_analysts must be an integer")
 
-    if state["max_analysts"] < 1 or state["max_analysts"] > 10:
+    if not 1 <= max_analysts <= 10:
         raise ValueError("max_analysts must be between 1 and 10")
 
     # Validate analysts list if present
     if "analysts" in state:
-        if not isinstance(state["analysts"], list):
+        analysts = state["analysts"]
+        if not isinstance(analysts, list):
             raise ValueError("analysts must be a list")
 
-        for analyst in state["analysts"]:
+        for analyst in analysts:
             if not isinstance(analyst, Analyst):
                 raise ValueError("All analysts must be Analyst instances")
 
@@ -355,6 +396,19 @@ def validate_research_state(state: ResearchGraphState) -> bool:
 
 # State Transformation Functions
 
+# Copied by create_initial_research_state; the list fields are replaced per state
+_INITIAL_RESEARCH_STATE: dict[str, Any] = {
+    "topic": "",
+    "max_analysts": 3,
+    "human_analyst_feedback": "",
+    "analysts": (),
+    "sections": (),
+    "introduction": "",
+    "content": "",
+    "conclusion": "",
+    "final_report": "",
+}
+
 
 def create_initial_research_state(
     topic: str, max_analysts: int = 3, human_analyst_feedback: str = ""
@@ -386,17 +440,13 @@ def create_initial_research_state(
     if max_analysts < 1 or max_analysts > 10:
         raise ValueError("max_analysts must be between 1 and 10")
 
-    state: ResearchGraphState = {
-        "topic": topic.strip(),
-        "max_analysts": max_analysts,
-        "human_analyst_feedback": human_analyst_feedback,
-        "analysts": [],
-        "sections": [],
-        "introduction": "",
-        "content": "",
-        "conclusion": "",
-        "final_report": "",
-    }
+    state = cast(ResearchGraphState, dict(_INITIAL_RESEARCH_STATE))
+    state["topic"] = topic.strip()
+    state["max_analysts"] = max_analysts
+    state["human_analyst_feedback"] = human_analyst_feedback
+    # Fresh lists so states never share mutable fields
+    state["analysts"] = []
+    state["sections"] = []
 
     return state
 
@@ -440,6 +490,7 @@ def create_interview_state(
         "analyst": analyst,
         "interview": "",
         "sections": [],
+        "expert_turn_count": 0,
     }
 
     return state
@@ -464,9 +515,14 @@ def get_interview_turn_count(state: InterviewState) -> int:
         >>> turn_count = get_interview_turn_count(state)
         >>> print(f"Completed {turn_count} turns")
     """
-    messages = state.get("messages", [])
-    expert_responses = [m for m in messages if isinstance(m, AIMessage) and m.name == "expert"]
-    return len(expert_responses)
+    count = state.get("expert_turn_count")
+    if count:
+        return count
+
+    # Fall back to scanning states built without the counter (or where it is
+    # still the channel default of 0)
+    messages = state.get("messages", ())
+    return sum(1 for m in messages if isinstance(m, AIMessage) and m.name == "expert")
 
 
 def get_total_context_length(state: InterviewState) -> int:
@@ -483,7 +539,15 @@ def get_total_context_length(state: InterviewState) -> int:
         >>> print(f"Total context: {context_length} characters")
     """
     context: list[Any] = state.get("context", [])  # Explicit unpack to narrow
-    return sum(len(str(doc)) for doc in context)  # str() safe for Any; removes isinstance if
+    if not context:
+        return 0
+    # str() returns str documents unchanged and covers any non-str entries
+    return sum(map(len, map(str, context)))
+
+
+def _has_text(value: str) -> bool:
+    # Same as bool(value.strip()) without copying the string
+    return bool(value) and not value.isspace()
 
 
 def get_research_progress(state: ResearchGraphState) -> dict[str, Any]:
@@ -508,10 +572,10 @@ def get_research_progress(state: ResearchGraphState) -> dict[str, Any]:
     return {
         "analysts_created": len(state.get("analysts", [])),
         "interviews_completed": len(state.get("sections", [])),
-        "has_introduction": bool(state.get("introduction", "").strip()),
-        "has_content": bool(state.get("content", "").strip()),
-        "has_conclusion": bool(state.get("conclusion", "").strip()),
-        "has_final_report": bool(state.get("final_report", "").strip()),
+        "has_introduction": _has_text(state.get("introduction", "")),
+        "has_content": _has_text(state.get("content", "")),
+        "has_conclusion": _has_text(state.get("conclusion", "")),
+        "has_final_report": _has_text(state.get("final_report", "")),
     }
 
 
@@ -528,11 +592,45 @@ def is_research_complete(state: ResearchGraphState) -> bool:
         >>> if is_research_complete(state):
         ...     print("Research complete! Report ready.")
     """
-    return bool(state.get("final_report", "").strip())
+    return _has_text(state.get("final_report", ""))
 
 
 # State Serialization Functions
 
+_ANALYST_FIELDS = tuple(Analyst.model_fields)
+
+
+def analyst_to_dict(analyst: Analyst) -> AnalystDict:
+    """Convert an Analyst into an AnalystDict.
+
+    Analysts are flat, so field values are copied straight from the instance
+    dict instead of running the serializer.
+
+    Args:
+        analyst: The Analyst instance to convert.
+
+    Returns:
+        AnalystDict holding the analyst's field values.
+    """
+    values = analyst.__dict__
+    return cast(AnalystDict, {name: values[name] for name in _ANALYST_FIELDS})
+
+
+def analyst_from_dict(data: AnalystDict, trusted: bool = True) -> Analyst:
+    """Convert an AnalystDict back into an Analyst.
+
+    Args:
+        data: Analyst field values.
+        trusted: If True (default), skip validation because the values came
+            from an already-validated Analyst.
+
+    Returns:
+        Analyst instance.
+    """
+    if trusted:
+        return Analyst.from_trusted(data)
+    return Analyst.model_validate(data)
+
 
 def serialize_state_for_checkpoint(state: ResearchGraphState) -> dict[str, Any]:
     """Serialize state for checkpointing/persistence.
@@ -544,24 +642,32 @@ def serialize_state_for_checkpoint(state: ResearchGraphState) -> dict[str, Any]:
         state: The state to serialize.
 
     Returns:
-        JSON-serializable dictionary.
+        JSON-serializable dictionary. When there are no analysts to convert,
+        this is ``state`` itself rather than a copy, so treat it as read-only.
 
     Example:
         >>> serialized = serialize_state_for_checkpoint(state)
         >>> import json
         >>> json.dumps(serialized)  # Can now be saved
     """
+    analysts = state.get("analysts")
+    if not analysts or not isinstance(analysts, list):
+        # Nothing to convert; the remaining fields are already JSON-safe
+        return cast(dict[str, Any], state)
+
     serialized = dict(state)
 
     # Convert Analyst objects to dictionaries
-    if "analysts" in serialized and isinstance(serialized["analysts"], list):
-        analysts_list = serialized["analysts"]
-        serialized["analysts"] = [analyst.model_dump() for analyst in analysts_list]
+    serialized["analysts"] = [
+        analyst if isinstance(analyst, dict) else analyst_to_dict(analyst) for analyst in analysts
+    ]
 
     return serialized
 
 
-def deserialize_state_from_checkpoint(data: dict[str, Any]) -> ResearchGraphState:
+def deserialize_state_from_checkpoint(
+    data: dict[str, Any], trusted: bool = False
+) -> ResearchGraphState:
     """Deserialize state from a checkpoint.
 
     Reconstructs state from a JSON-serializable format, converting
@@ -569,6 +675,10 @@ def deserialize_state_from_checkpoint(data: dict[str, Any]) -> ResearchGraphStat
 
     Args:
         data: The serialized state data.
+        trusted: If True, the data was written by this process with
+            ``serialize_state_for_checkpoint`` and analysts are rebuilt
+            without re-validation. Defaults to False, which validates the
+            analysts; keep it for data read from disk or the network.
 
     Returns:
         Reconstructed ResearchGraphState.
@@ -594,26 +704,74 @@ def deserialize_state_from_checkpoint(data: dict[str, Any]) -> ResearchGraphStat
     # Convert analyst dicts back to Analyst objects
     analysts_data = state["analysts"]
     if analysts_data and isinstance(analysts_data[0], dict):
-        state["analysts"] = [Analyst(**analyst_dict) for analyst_dict in analysts_data]
+        if trusted:
+            # Checkpoints hold field values of already-validated analysts
+            state["analysts"] = [analyst_from_dict(analyst_dict) for analyst_dict in analysts_data]
+        else:
+            state["analysts"] = validate_analyst_list(analysts_data)
 
     return cast(ResearchGraphState, state)
 
 
+def serialize_state_to_json_bytes(state: ResearchGraphState) -> bytes:
+    """Serialize state straight to JSON bytes for checkpointing.
+
+    Uses pydantic-core's native encoder, which writes Analyst models without
+    an intermediate dict copy or a stdlib ``json`` pass.
+
+    Args:
+        state: The state to serialize.
+
+    Returns:
+        UTF-8 encoded JSON.
+
+    Example:
+        >>> payload = serialize_state_to_json_bytes(state)
+        >>> restored = deserialize_state_from_json_bytes(payload)
+    """
+    return to_json(state)
+
+
+def deserialize_state_from_json_bytes(
+    data: bytes | str, trusted: bool = False
+) -> ResearchGraphState:
+    """Deserialize state from JSON produced by serialize_state_to_json_bytes.
+
+    Args:
+        data: JSON bytes or string.
+        trusted: Passed to deserialize_state_from_checkpoint.
+
+    Returns:
+        Reconstructed ResearchGraphState.
+    """
+    return deserialize_state_from_checkpoint(from_json(data), trusted=trusted)
+
+
 # Utility function for state updates
 
+# Fields that use operator.add (append instead of replace)
+_ADDITIVE_STATE_FIELDS = frozenset({"context", "sections"})
+_COUNTER_STATE_FIELDS = frozenset({"expert_turn_count"})
+
 
-def merge_state_updates(current_state: dict[str, Any], updates: dict[str, Any]) -> dict[str, Any]:
+def merge_state_updates(
+    current_state: dict[str, Any], updates: dict[str, Any], *, in_place: bool = False
+) -> dict[str, Any]:
     """Merge state updates with special handling for annotated fields.
 
-    This function properly handles fields with Annotated[list, operator.add]
-    by appending rather than replacing.
+    This function properly handles fields with Annotated[..., operator.add]
+    by appending (or, for counters, adding) rather than replacing.
 
     Args:
         current_state: The current state dictionary.
         updates: Dictionary of updates to apply.
+        in_place: If True, apply the updates to ``current_state`` and extend its
+            additive lists directly instead of copying them. Use only when the
+            caller owns the state and its lists.
 
     Returns:
-        New state dictionary with updates applied.
+        State dictionary with updates applied (``current_state`` itself when
+        ``in_place`` is True).
 
     Example:
         >>> new_state = merge_state_updates(
@@ -623,20 +781,30 @@ def merge_state_updates(current_state: dict[str, Any], updates: dict[str, Any])
         >>> new_state["sections"]
         ['intro', 'body']
     """
-    new_state = current_state.copy()
-
-    # Fields that use operator.add (append instead of replace)
-    additive_fields = {"context", "sections"}
-
-    for key, value in updates.items():
-        if key in additive_fields and key in new_state:
-            # Append to existing list
-            if isinstance(value, list):
-                new_state[key] = new_state[key] + value
-            else:
-                new_state[key] = new_state[key] + [value]
+    # Only fields present on both sides need operator.add fix-ups
+    counter_keys = _COUNTER_STATE_FIELDS & updates.keys() & current_state.keys()
+    additive_keys = _ADDITIVE_STATE_FIELDS & updates.keys() & current_state.keys()
+    previous = {key: current_state[key] for key in counter_keys | additive_keys}
+
+    if in_place:
+        merged = current_state
+        merged.update(updates)
+    else:
+        merged = current_state | updates
+
+    for key in counter_keys:
+        merged[key] = previous[key] + updates[key]
+
+    for key in additive_keys:
+        value = updates[key]
+        # Append to existing list
+        if in_place:
+            merged[key] = base = previous[key]
+        else:
+            merged[key] = base = list(previous[key])
+        if isinstance(value, list):
+            base.extend(value)
         else:
-            # Replace value
-            new_state[key] = value
+            base.append(value)
 
-    return new_state
+    return merged
@@ -1,17 +1,43 @@
-"""Graph builders for research assistant workflows."""
-
-from .interview_graph import build_interview_graph, create_interview_config
-from .research_graph import (
-    build_research_graph,
-    continue_research,
-    create_research_config,
-    create_research_system,
-    run_research,
-    stream_research,
-)
+"""Graph builders for research assistant workflows.
+
+Builders are loaded on first access so importing this package does not pull
+in the graph modules (and their LangGraph/LLM client imports) up front.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .interview_graph import (
+        build_interview_graph,
+        clear_interview_graph_cache,
+        create_interview_config,
+    )
+    from .research_graph import (
+        build_research_graph,
+        continue_research,
+        create_research_config,
+        create_research_system,
+        run_research,
+        stream_research,
+    )
+
+# Public name -> submodule that defines it
+_LAZY_EXPORTS = {
+    "build_interview_graph": ".interview_graph",
+    "clear_interview_graph_cache": ".interview_graph",
+    "create_interview_config": ".interview_graph",
+    "build_research_graph": ".research_graph",
+    "create_research_config": ".research_graph",
+    "run_research": ".research_graph",
+    "stream_research": ".research_graph",
+    "continue_research": ".research_graph",
+    "create_research_system": ".research_graph",
+}
 
 __all__ = [
     "build_interview_graph",
+    "clear_interview_graph_cache",
     "create_interview_config",
     "build_research_graph",
     "create_research_config",
@@ -20,3 +46,16 @@ __all__ = [
     "continue_research",
     "create_research_system",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
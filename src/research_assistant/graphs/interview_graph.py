@@ -10,9 +10,13 @@ Example:
     >>> result = interview_graph.invoke(initial_state)
 """
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from typing import Any, cast
 
+from langchain_core.runnables import RunnableLambda
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, START
 from langgraph.graph.state import CompiledStateGraph, StateGraph
@@ -24,8 +28,9 @@ from ..nodes.interview_nodes import (
     route_messages,
     save_interview,
 )
-from ..nodes.report_nodes import write_section
+from ..nodes.report_nodes import awrite_section, write_section
 from ..tools.search import SearchQueryGenerator, WebSearchTool, WikipediaSearchTool
+from .visualization import render_mermaid_png
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -159,6 +164,134 @@ def search_wikipedia_node(
         return {"context": []}
 
 
+def _format_search(search_tool: Any, query: str, source: str) -> str | None:
+    """Run one search and format it, returning None if the search fails."""
+    try:
+        results = search_tool.search(query)
+    except Exception as e:
+        logger.error(f"{source} search failed: {str(e)}", exc_info=True)
+        return None
+
+    logger.info(f"{source} search completed: {len(results)} results")
+    return cast(str, search_tool.format_results(results))
+
+
+async def _aformat_search(search_tool: Any, query: str, source: str) -> str | None:
+    """Async variant of _format_search."""
+    try:
+        results = await search_tool.asearch(query)
+    except Exception as e:
+        logger.error(f"{source} search failed: {str(e)}", exc_info=True)
+        return None
+
+    logger.info(f"{source} search completed: {len(results)} results")
+    return cast(str, search_tool.format_results(results))
+
+
+def search_node(
+    state: InterviewState,
+    web_search_tool: WebSearchTool,
+    wiki_search_tool: WikipediaSearchTool,
+    query_generator: SearchQueryGenerator,
+) -> dict[str, Any]:
+    """Node to run web and Wikipedia searches for the current question.
+
+    Generates the search query once, then runs both searches concurrently.
+    A failed search contributes no context instead of failing the interview.
+
+    Args:
+        state: Current interview state with messages.
+        web_search_tool: WebSearchTool instance.
+        wiki_search_tool: WikipediaSearchTool instance.
+        query_generator: SearchQueryGenerator instance.
+
+    Returns:
+        Dictionary with 'context' containing the formatted results of each
+        successful search.
+
+    Example:
+        >>> result = search_node(state, web_tool, wiki_tool, generator)
+        >>> print(len(result['context']))
+    """
+    logger.info("Executing search node")
+
+    messages = state.get("messages", [])
+
+    if not messages:
+        logger.warning("No messages in state for search query generation")
+        return {"context": []}
+
+    try:
+        search_query = query_generator.generate_from_messages(messages).search_query
+    except Exception as e:
+        logger.error(f"Search query generation failed: {str(e)}", exc_info=True)
+        return {"context": []}
+
+    if not search_query:
+        logger.warning("Empty search query generated")
+        return {"context": []}
+
+    logger.info(f"Generated query: {search_query}")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        web_future = executor.submit(_format_search, web_search_tool, search_query, "Web")
+        wiki_future = executor.submit(
+            _format_search, wiki_search_tool, search_query, "Wikipedia"
+        )
+        results = [web_future.result(), wiki_future.result()]
+
+    return {"context": [result for result in results if result is not None]}
+
+
+async def asearch_node(
+    state: InterviewState,
+    web_search_tool: WebSearchTool,
+    wiki_search_tool: WikipediaSearchTool,
+    query_generator: SearchQueryGenerator,
+) -> dict[str, Any]:
+    """Async variant of search_node, used when the graph runs asynchronously.
+
+    Args:
+        state: Current interview state with messages.
+        web_search_tool: WebSearchTool instance.
+        wiki_search_tool: WikipediaSearchTool instance.
+        query_generator: SearchQueryGenerator instance.
+
+    Returns:
+        Dictionary with 'context' containing the formatted results of each
+        successful search.
+
+    Example:
+        >>> result = await asearch_node(state, web_tool, wiki_tool, generator)
+    """
+    logger.info("Executing search node")
+
+    messages = state.get("messages", [])
+
+    if not messages:
+        logger.warning("No messages in state for search query generation")
+        return {"context": []}
+
+    try:
+        search_query = (await query_generator.agenerate_from_messages(messages)).search_query
+    except Exception as e:
+        logger.error(f"Search query generation failed: {str(e)}", exc_info=True)
+        return {"context": []}
+
+    if not search_query:
+        logger.warning("Empty search query generated")
+        return {"context": []}
+
+    logger.info(f"Generated query: {search_query}")
+
+    results = await asyncio.gather(
+        _aformat_search(web_search_tool, search_query, "Web"),
+        _aformat_search(wiki_search_tool, search_query, "Wikipedia"),
+    )
+
+    return {"context": [result for result in results if result is not None]}
+
+
 def build_interview_graph(
     llm: ChatOpenAI | None = None,
     web_search_tool: WebSearchTool | None = None,
@@ -172,6 +305,10 @@ def build_interview_graph(
     analyst and expert, including question generation, search, and answer
     generation.
 
+    When no LLM, tools or query generator are injected, the default graph is
+    built once per ``detailed_prompts`` value and reused; the compiled graph
+    holds no per-run state. Use clear_interview_graph_cache to rebuild it.
+
     Args:
         llm: Optional LLM instance for all nodes.
         web_search_tool: Optional web search tool instance.
@@ -186,6 +323,39 @@ def build_interview_graph(
         >>> graph = build_interview_graph()
         >>> result = graph.invoke({"analyst": analyst, "messages": [...]})
     """
+    injected = (llm, web_search_tool, wiki_search_tool, query_generator)
+    if all(dependency is None for dependency in injected):
+        return _default_interview_graph(detailed_prompts)
+
+    return _build_interview_graph(
+        llm, web_search_tool, wiki_search_tool, query_generator, detailed_prompts
+    )
+
+
+@lru_cache(maxsize=2)
+def _default_interview_graph(
+    detailed_prompts: bool,
+) -> CompiledStateGraph[InterviewState, None, InterviewState, InterviewState]:
+    return _build_interview_graph(None, None, None, None, detailed_prompts)
+
+
+def clear_interview_graph_cache() -> None:
+    """Drop the cached default interview graphs (and their LLM/search clients).
+
+    Example:
+        >>> clear_interview_graph_cache()
+        >>> graph = build_interview_graph()  # Rebuilt from scratch
+    """
+    _default_interview_graph.cache_clear()
+
+
+def _build_interview_graph(
+    llm: ChatOpenAI | None,
+    web_search_tool: WebSearchTool | None,
+    wiki_search_tool: WikipediaSearchTool | None,
+    query_generator: SearchQueryGenerator | None,
+    detailed_prompts: bool,
+) -> CompiledStateGraph[InterviewState, None, InterviewState, InterviewState]:
     logger.info("Building interview subgraph")
 
     # Initialize default tools if not provided
@@ -205,46 +375,45 @@ def build_interview_graph(
     # Create graph builder
     builder = StateGraph(InterviewState)
 
-    # Define node functions with partial application for injected dependencies
-    def ask_question_node(state: InterviewState) -> dict[str, Any]:
-        return generate_question(state, llm=llm, detailed_prompts=detailed_prompts)
-
-    def search_web_wrapper(state: InterviewState) -> dict[str, Any]:
-        return search_web_node(state, search_tool=web_search_tool, query_generator=query_generator)
-
-    def search_wikipedia_wrapper(state: InterviewState) -> dict[str, Any]:
-        return search_wikipedia_node(
-            state, search_tool=wiki_search_tool, query_generator=query_generator
-        )
-
-    def answer_question_node(state: InterviewState) -> dict[str, Any]:
-        return generate_answer(state, llm=llm, detailed_prompts=detailed_prompts)
-
-    def save_interview_node(state: InterviewState) -> dict[str, Any]:
-        return save_interview(state)
-
-    def write_section_node(state: InterviewState) -> dict[str, Any]:
-        return write_section(state, llm=llm, detailed_prompts=detailed_prompts)
+    # Bind injected dependencies with partial application
+    ask_question_node = partial(generate_question, llm=llm, detailed_prompts=detailed_prompts)
+    answer_question_node = partial(generate_answer, llm=llm, detailed_prompts=detailed_prompts)
+    # Sync and async implementations so both invoke() and ainvoke() work
+    search_runnable = RunnableLambda(
+        partial(
+            search_node,
+            web_search_tool=web_search_tool,
+            wiki_search_tool=wiki_search_tool,
+            query_generator=query_generator,
+        ),
+        afunc=partial(
+            asearch_node,
+            web_search_tool=web_search_tool,
+            wiki_search_tool=wiki_search_tool,
+            query_generator=query_generator,
+        ),
+    )
+    write_section_runnable = RunnableLambda(
+        partial(write_section, llm=llm, detailed_prompts=detailed_prompts),
+        afunc=partial(awrite_section, llm=llm, detailed_prompts=detailed_prompts),
+    )
 
     # Add nodes
     builder.add_node("ask_question", ask_question_node)
-    builder.add_node("search_web", search_web_wrapper)
-    builder.add_node("search_wikipedia", search_wikipedia_wrapper)
+    builder.add_node("search", search_runnable)
     builder.add_node("answer_question", answer_question_node)
-    builder.add_node("save_interview", save_interview_node)
-    builder.add_node("write_section", write_section_node)
+    builder.add_node("save_interview", save_interview)
+    builder.add_node("write_section", write_section_runnable)
 
     # Define edges
     # Start -> ask question
     builder.add_edge(START, "ask_question")
 
-    # After asking question, do both searches in parallel
-    builder.add_edge("ask_question", "search_web")
-    builder.add_edge("ask_question", "search_wikipedia")
+    # After asking question, search (web and Wikipedia run concurrently)
+    builder.add_edge("ask_question", "search")
 
-    # Both searches -> answer question
-    builder.add_edge("search_web", "answer_question")
-    builder.add_edge("search_wikipedia", "answer_question")
+    # Search -> answer question
+    builder.add_edge("search", "answer_question")
 
     # After answer, route to either ask another question or save interview
     builder.add_conditional_edges(
@@ -314,15 +483,15 @@ def get_interview_graph_info() -> dict[str, Any]:
         "description": "Manages analyst-expert interviews with search integration",
         "nodes": [
             "ask_question",
-            "search_web",
-            "search_wikipedia",
+            "search",
             "answer_question",
             "save_interview",
             "write_section",
         ],
         "entry_point": "ask_question",
         "exit_point": "write_section",
-        "parallel_nodes": ["search_web", "search_wikipedia"],
+        # Web and Wikipedia searches run concurrently inside the search node
+        "concurrent_searches": ["web", "wikipedia"],
         "conditional_edges": {"answer_question": ["ask_question", "save_interview"]},
         "max_iterations": "Determined by max_num_turns in state",
         "output": "Report section with citations",
@@ -353,7 +522,7 @@ def visualize_interview_graph(
             graph = build_interview_graph()
 
         # Generate visualization
-        img_data = graph.get_graph().draw_mermaid_png()
+        img_data = render_mermaid_png(graph)
 
         # Save to file
         path = Path(output_path)
@@ -26,6 +26,7 @@ from ..core.state import GenerateAnalystsState, ResearchGraphState
 from ..nodes.analyst_nodes import create_analysts, human_feedback
 from ..nodes.report_nodes import finalize_report, write_conclusion, write_introduction, write_report
 from .interview_graph import build_interview_graph
+from .visualization import render_mermaid_png
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -84,7 +85,7 @@ def initiate_all_interviews(state: ResearchGraphState) -> str | list[Send]:
             {
                 "analyst": analyst,
                 "messages": [initial_message],
-                "max_num_turns": state.get("max_num_turns", 2),
+                "max_num_turns": state.get("max_interview_turns", 2),
             },
         )
         send_objects.append(send_obj)
@@ -127,12 +128,8 @@ def build_research_graph(
     """
     logger.info("Building main research graph")
 
-    # Initialize default LLM if not provided
-    if llm is None:
-        llm = ChatOpenAI(model="gpt-4o", temperature=0)
-        logger.debug("Using default LLM: gpt-4o")
-
-    # Build interview subgraph if not provided
+    # Build interview subgraph if not provided. Without an injected LLM the
+    # default subgraph is shared (see build_interview_graph)
     if interview_graph is None:
         logger.debug("Building default interview subgraph")
         interview_graph = cast(
@@ -140,6 +137,11 @@ def build_research_graph(
             build_interview_graph(llm=llm, detailed_prompts=detailed_prompts),
         )
 
+    # Initialize default LLM if not provided
+    if llm is None:
+        llm = ChatOpenAI(model="gpt-4o", temperature=0)
+        logger.debug("Using default LLM: gpt-4o")
+
     # Create graph builder
     builder: StateGraph[ResearchGraphState] = StateGraph(ResearchGraphState)
 
@@ -466,7 +468,7 @@ def visualize_research_graph(
             graph = build_research_graph()
 
         # Generate visualization
-        img_data = graph.get_graph().draw_mermaid_png()
+        img_data = render_mermaid_png(graph)
 
         # Save to file
         output_path_obj: Path = Path(output_path)
@@ -620,6 +622,8 @@ def create_research_system(
     web_max_results: int = 3,
     wiki_max_docs: int = 2,
     use_cache: bool = True,
+    http_client: Any | None = None,
+    http_async_client: Any | None = None,
 ) -> dict[str, Any]:
     """Factory function to create a complete configured research system.
 
@@ -631,6 +635,10 @@ def create_research_system(
         web_max_results: Maximum web search results.
         wiki_max_docs: Maximum Wikipedia documents.
         use_cache: Whether to enable search caching.
+        http_client: Optional shared ``httpx.Client`` for sync LLM calls, so
+            connections are pooled across systems.
+        http_async_client: Optional shared ``httpx.AsyncClient`` for async
+            LLM calls.
 
     Returns:
         Dictionary with 'graph', 'llm', and 'config' keys.
@@ -642,8 +650,13 @@ def create_research_system(
     """
     logger.info("Creating research system")
 
-    # Initialize LLM
-    llm = ChatOpenAI(model=llm_model, temperature=llm_temperature)
+    # Initialize LLM (reusing caller-provided connection pools when given)
+    llm = ChatOpenAI(
+        model=llm_model,
+        temperature=llm_temperature,
+        http_client=http_client,
+        http_async_client=http_async_client,
+    )
 
     # Import tools
     from ..tools.search import WebSearchTool, WikipediaSearchTool
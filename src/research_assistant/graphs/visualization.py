@@ -0,0 +1,43 @@
+"""Rendering helpers shared by the graph visualization functions.
+
+Example:
+    >>> from research_assistant.graphs.visualization import render_mermaid_png
+    >>> png_bytes = render_mermaid_png(build_interview_graph())
+"""
+
+import logging
+from functools import lru_cache
+from typing import Any
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+
+def render_mermaid_png(graph: Any) -> bytes:
+    """Render a compiled graph to PNG, reusing earlier renders of the same structure.
+
+    ``draw_mermaid_png`` makes a network round trip to the Mermaid rendering
+    service, while the Mermaid source it renders is generated locally, so the
+    rendered bytes are cached per source text. The cache is bounded, and
+    rendering only happens when a ``visualize_*`` function is called, so there
+    is no separate opt-in flag.
+
+    Args:
+        graph: Compiled LangGraph graph.
+
+    Returns:
+        PNG image bytes.
+
+    Example:
+        >>> png_bytes = render_mermaid_png(graph)
+    """
+    return _mermaid_source_to_png(graph.get_graph().draw_mermaid())
+
+
+@lru_cache(maxsize=16)
+def _mermaid_source_to_png(mermaid_syntax: str) -> bytes:
+    """Render Mermaid source to PNG bytes, memoized per source text."""
+    from langchain_core.runnables.graph_mermaid import draw_mermaid_png
+
+    logger.debug("Rendering graph with the Mermaid service")
+    return draw_mermaid_png(mermaid_syntax=mermaid_syntax)
@@ -22,6 +22,7 @@ from typing import Any
 from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 
+from ..cache.llm_cache import cached_invoke
 from ..core.schemas import Analyst, Perspectives
 from ..core.state import GenerateAnalystsState
 from ..prompts.analyst_prompts import format_analyst_instructions
@@ -39,7 +40,7 @@ class AnalystCreationError(Exception):
 
 @with_fallback()
 def _invoke_llm_for_report(llm: Any, messages: Any) -> Any:
-    return llm.invoke(messages)
+    return cached_invoke(llm, messages)
 
 
 def create_analysts(
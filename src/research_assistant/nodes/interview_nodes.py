@@ -12,6 +12,7 @@ Example:
 """
 
 import logging
+from collections.abc import Sequence
 from typing import Any, Literal
 
 from langchain_core.messages import (
@@ -23,6 +24,7 @@ from langchain_core.messages import (
 )
 from langchain_openai import ChatOpenAI
 
+from ..cache.llm_cache import cached_invoke
 from ..core.schemas import Analyst
 from ..core.state import InterviewState
 from ..prompts.interview_prompts import (
@@ -44,7 +46,7 @@ class InterviewError(Exception):
 
 @with_fallback()
 def _invoke_llm_for_report(llm: Any, messages: Any) -> Any:
-    return llm.invoke(messages)
+    return cached_invoke(llm, messages)
 
 
 def generate_question(
@@ -150,7 +152,9 @@ def generate_answer(
         detailed_prompts: If True, use more detailed instructions.
 
     Returns:
-        Dictionary with 'messages' containing the expert's answer.
+        Dictionary with 'messages' containing the expert's answer and an
+        'expert_turn_count' increment (1, plus any earlier expert answers when
+        the counter has not been started yet).
 
     Raises:
         InterviewError: If answer generation fails.
@@ -215,7 +219,11 @@ def generate_answer(
         logger.debug(f"Generated answer length: {len(answer.content)} chars")
         logger.info("Successfully generated expert answer")
 
-        return {"messages": [answer]}
+        # States that enter with earlier expert answers but no counter (hand-built
+        # or resumed) start from 0, so seed the counter on their first answer
+        increment = 1 if state.get("expert_turn_count") else 1 + _count_expert_messages(messages)
+
+        return {"messages": [answer], "expert_turn_count": increment}
 
     except Exception as e:
         logger.error(f"Failed to generate answer: {str(e)}", exc_info=True)
@@ -262,6 +270,12 @@ def save_interview(state: InterviewState) -> dict[str, Any]:
         return {"interview": ""}
 
 
+def _count_expert_messages(messages: Sequence[Any], expert_name: str = "expert") -> int:
+    return sum(
+        1 for m in messages if isinstance(m, AIMessage) and getattr(m, "name", None) == expert_name
+    )
+
+
 def route_messages(
     state: InterviewState, expert_name: str = "expert"
 ) -> Literal["ask_question", "save_interview"]:
@@ -289,14 +303,12 @@ def route_messages(
     messages = state.get("messages", [])
     max_num_turns = state.get("max_num_turns", 2)
 
-    # Count expert responses (completed turns)
-    num_responses = len(
-        [
-            m
-            for m in messages
-            if isinstance(m, AIMessage) and getattr(m, "name", None) == expert_name
-        ]
-    )
+    # Count expert responses (completed turns), using the running counter
+    # maintained by generate_answer when available. A missing or zero counter
+    # may just be the channel default, so fall back to scanning the messages
+    num_responses = state.get("expert_turn_count") if expert_name == "expert" else None
+    if not num_responses:
+        num_responses = _count_expert_messages(messages, expert_name)
 
     logger.debug(f"Interview routing: {num_responses} responses out of {max_num_turns} max turns")
 
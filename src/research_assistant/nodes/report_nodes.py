@@ -18,6 +18,7 @@ from typing import Any, cast
 from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 
+from ..cache.llm_cache import acached_invoke, cached_invoke
 from ..core.state import InterviewState, ResearchGraphState
 from ..prompts.report_prompts import (
     format_conclusion_instructions,
@@ -39,7 +40,7 @@ class ReportGenerationError(Exception):
 
 @with_fallback()
 def _invoke_llm_for_report(llm: Any, messages: Any) -> Any:
-    return llm.invoke(messages)
+    return cached_invoke(llm, messages)
 
 
 def write_section(
@@ -73,6 +74,56 @@ def write_section(
     """
     logger.info("Writing report section")
 
+    messages, llm = _prepare_section(state, llm, detailed_prompts)
+
+    try:
+        logger.info("Invoking LLM for section writing")
+        section: BaseMessage | None = _invoke_llm_for_report(llm, messages)
+        return {"sections": [_section_content(section)]}
+
+    except Exception as e:
+        logger.error(f"Failed to write section: {str(e)}", exc_info=True)
+        raise ReportGenerationError(f"Section writing failed: {str(e)}") from e
+
+
+async def awrite_section(
+    state: InterviewState, llm: ChatOpenAI | None = None, detailed_prompts: bool = False
+) -> dict[str, Any]:
+    """Async variant of write_section, awaiting ``llm.ainvoke`` for the section.
+
+    Used when the interview graph runs under ``ainvoke``/``astream`` so that
+    sections for parallel interviews are written concurrently on the event
+    loop rather than each occupying an executor thread.
+
+    Args:
+        state: Interview state with interview transcript and context.
+        llm: Optional LLM instance.
+        detailed_prompts: If True, use more detailed instructions.
+
+    Returns:
+        Dictionary with 'sections' containing the new section.
+
+    Raises:
+        ReportGenerationError: If section writing fails.
+        ValueError: If required state fields are missing.
+    """
+    logger.info("Writing report section")
+
+    messages, llm = _prepare_section(state, llm, detailed_prompts)
+
+    try:
+        logger.info("Invoking LLM for section writing")
+        section: BaseMessage | None = await acached_invoke(llm, messages)
+        return {"sections": [_section_content(section)]}
+
+    except Exception as e:
+        logger.error(f"Failed to write section: {str(e)}", exc_info=True)
+        raise ReportGenerationError(f"Section writing failed: {str(e)}") from e
+
+
+def _prepare_section(
+    state: InterviewState, llm: ChatOpenAI | None, detailed_prompts: bool
+) -> tuple[list[BaseMessage], ChatOpenAI]:
     # Extract state
     interview = state.get("interview", "")
     context = state.get("context", [])
@@ -103,28 +154,22 @@ def write_section(
         analyst_focus=analyst.description, context=context_str, detailed=detailed_prompts
     )
 
-    # Create messages - use context as the primary source
-    messages = [
+    # Create messages - the sources are already in the system message, so they
+    # are not repeated here
+    messages: list[BaseMessage] = [
         SystemMessage(content=system_message_content),
-        HumanMessage(content=f"Use this source to write your section: {context_str}"),
+        HumanMessage(content="Write your section using the source documents above."),
     ]
+    return messages, llm
 
-    try:
-        logger.info("Invoking LLM for section writing")
-        section: BaseMessage | None = _invoke_llm_for_report(llm, messages)
 
-        section_content = (
-            section.content if section and hasattr(section, "content") else str(section)
-        )
-
-        logger.debug(f"Generated section length: {len(section_content)} chars")
-        logger.info("Successfully generated report section")
+def _section_content(section: BaseMessage | None) -> str:
+    section_content = section.content if section and hasattr(section, "content") else str(section)
 
-        return {"sections": [section_content]}
+    logger.debug(f"Generated section length: {len(section_content)} chars")
+    logger.info("Successfully generated report section")
 
-    except Exception as e:
-        logger.error(f"Failed to write section: {str(e)}", exc_info=True)
-        raise ReportGenerationError(f"Section writing failed: {str(e)}") from e
+    return cast(str, section_content)
 
 
 def write_report(
@@ -80,17 +80,15 @@ Remember: Your job is to uncover insights that will be valuable to an informed a
 Avoid surface-level questions."""
 
 
-# Expert answer generation instructions
+# Expert answer generation instructions. {context} is kept last: it grows by
+# appending each turn, so everything before the newest documents stays a stable
+# prefix for provider-side prompt caching.
 ANSWER_GENERATION_INSTRUCTIONS = """You are an expert being interviewed by an analyst.
 
 Here is analyst area of focus: {goals}.
 
 You goal is to answer a question posed by the interviewer.
 
-To answer question, use this context:
-
-{context}
-
 When answering questions, follow these guidelines:
 
 1. Use only the information provided in the context.
@@ -110,7 +108,11 @@ When answering questions, follow these guidelines:
 
 [1] assistant/docs/llama3_1.pdf, page 7
 
-And skip the addition of the brackets as well as the Document source preamble in your citation."""
+And skip the addition of the brackets as well as the Document source preamble in your citation.
+
+To answer question, use this context:
+
+{context}"""
 
 
 # Enhanced expert answer instructions
@@ -121,9 +123,6 @@ Your goal is to provide informative, accurate answers based solely on the provid
 ANALYST'S FOCUS AREA:
 {goals}
 
-CONTEXT DOCUMENTS:
-{context}
-
 ANSWERING GUIDELINES:
 
 1. ACCURACY AND GROUNDING
@@ -158,7 +157,10 @@ ANSWERING GUIDELINES:
    - Provide context to help interpret the information
 
 Remember: You are synthesizing information from sources, not inventing it.
-Every factual claim should trace back to the provided context."""
+Every factual claim should trace back to the provided context.
+
+CONTEXT DOCUMENTS:
+{context}"""
 
 
 # Search query generation instruction
@@ -8,15 +8,13 @@ Example:
     >>> instructions = format_section_instructions(analyst_focus, context_docs)
 """
 
-# Section writing instructions
+# Section writing instructions. The per-analyst focus and sources come last so
+# the static instructions form a prompt-cache prefix shared by every section.
 SECTION_WRITER_INSTRUCTIONS = """You are an expert technical writer.
 
 Your task is to create a short, easily digestible section of a report based
 on a set of source documents.
 
-SOURCE DOCUMENTS:
-{context}
-
 1. Analyze the content of the source documents:
 - The name of each source document is at the start of the document, with the <Document tag.
 
@@ -29,8 +27,7 @@ a. Title (## header)
 b. Summary (### header)
 c. Sources (### header)
 
-4. Make your title engaging based upon the focus area of the analyst:
-{focus}
+4. Make your title engaging based upon the focus area of the analyst (given below).
 
 5. For the summary section:
 - Set up summary with general background / context related to the focus area of the analyst
@@ -63,18 +60,18 @@ There should be no redundant sources. It should simply be:
 8. Final review:
 - Ensure the report follows the required structure
 - Include no preamble before the title of the report
-- Check that all guidelines have been followed"""
-
-
-# Enhanced section writing with more guidance
-SECTION_WRITER_DETAILED_INSTRUCTIONS = """
-You are an expert technical writer creating a section of a research report.
+- Check that all guidelines have been followed
 
 ANALYST'S FOCUS AREA:
 {focus}
 
 SOURCE DOCUMENTS:
-{context}
+{context}"""
+
+
+# Enhanced section writing with more guidance
+SECTION_WRITER_DETAILED_INSTRUCTIONS = """
+You are an expert technical writer creating a section of a research report.
 
 YOUR TASK:
 Transform the interview findings into a polished,
@@ -140,7 +137,13 @@ QUALITY CHECKLIST:
 ☐ No duplicate sources in source list
 ☐ No preamble before the title
 ☐ Markdown formatting is correct
-☐ Content focuses on insights, not process"""
+☐ Content focuses on insights, not process
+
+ANALYST'S FOCUS AREA:
+{focus}
+
+SOURCE DOCUMENTS:
+{context}"""
 
 
 # Report synthesis instructions
@@ -11,14 +11,17 @@ Example:
     >>> print(f"Found {len(results)} results")
 """
 
-import hashlib
+import asyncio
 import logging
+import threading
 import time
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone  # noqa: UP017
-from functools import wraps
-from typing import Any, ParamSpec, TypeVar
+from functools import partial, wraps
+from typing import Any, ParamSpec, TypeVar, cast
 
 # Load environment variables from .env if available
 from dotenv import load_dotenv
@@ -26,6 +29,7 @@ from langchain_community.document_loaders import WikipediaLoader
 from langchain_openai import ChatOpenAI
 from langchain_tavily import TavilySearch
 
+from ..cache.llm_cache import acached_invoke, cached_invoke
 from ..core.schemas import SearchQuery
 from ..prompts.interview_prompts import get_search_instructions_as_system_message
 
@@ -76,8 +80,25 @@ class CacheEntry:
         return age.total_seconds() > self.ttl_seconds
 
 
+def _search_key(query: str, search_type: str) -> str:
+    """Normalize a query (case and whitespace) into a key for caching and sharing.
+
+    Args:
+        query: Search query string.
+        search_type: Type of search (e.g., 'web', 'wikipedia').
+
+    Returns:
+        Key string.
+    """
+    return f"{search_type}:{' '.join(query.lower().split())}"
+
+
 class SearchCache:
-    """Simple in-memory cache for search results."""
+    """Thread-safe in-memory LRU cache for search results with per-entry TTL.
+
+    Queries are normalized (case and whitespace) so trivially different
+    phrasings of the same query share an entry.
+    """
 
     def __init__(self, max_size: int = 100):
         """Initialize search cache.
@@ -85,8 +106,9 @@ class SearchCache:
         Args:
             max_size: Maximum number of entries to cache.
         """
-        self._cache: dict[str, CacheEntry] = {}
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
         self._max_size = max_size
+        self._lock = threading.Lock()
         logger.debug(f"Initialized search cache with max_size={max_size}")
 
     def _generate_key(self, query: str, search_type: str) -> str:
@@ -99,8 +121,7 @@ class SearchCache:
         Returns:
             Cache key string.
         """
-        content = f"{search_type}:{query.lower().strip()}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        return _search_key(query, search_type)
 
     def get(self, query: str, search_type: str) -> list[dict[str, Any]] | None:
         """Get cached results if available and not expired.
@@ -113,16 +134,20 @@ class SearchCache:
             Cached results if available, None otherwise.
         """
         key = self._generate_key(query, search_type)
-        entry = self._cache.get(key)
 
-        if entry is None:
-            logger.debug(f"Cache miss for query: {query[:50]}")
-            return None
+        with self._lock:
+            entry = self._cache.get(key)
+
+            if entry is None:
+                logger.debug(f"Cache miss for query: {query[:50]}")
+                return None
+
+            if entry.is_expired():
+                logger.debug(f"Cache expired for query: {query[:50]}")
+                del self._cache[key]
+                return None
 
-        if entry.is_expired():
-            logger.debug(f"Cache expired for query: {query[:50]}")
-            del self._cache[key]
-            return None
+            self._cache.move_to_end(key)
 
         logger.info(f"Cache hit for query: {query[:50]}")
         return entry.results
@@ -138,12 +163,6 @@ class SearchCache:
             results: Search results to cache.
             ttl_seconds: Time-to-live in seconds.
         """
-        # Enforce max size by removing oldest entries
-        if len(self._cache) >= self._max_size:
-            oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k].timestamp)
-            del self._cache[oldest_key]
-            logger.debug("Cache full, removed oldest entry")
-
         key = self._generate_key(query, search_type)
         entry = CacheEntry(
             query=query,
@@ -152,12 +171,21 @@ class SearchCache:
             ttl_seconds=ttl_seconds,
         )
 
-        self._cache[key] = entry
+        with self._lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+
+            # Enforce max size by evicting the least recently used entries
+            while len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+                logger.debug("Cache full, removed least recently used entry")
+
         logger.debug(f"Cached results for query: {query[:50]}")
 
     def clear(self) -> None:
         """Clear all cached entries."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
         logger.info("Search cache cleared")
 
     def get_stats(self) -> dict[str, Any]:
@@ -166,8 +194,9 @@ class SearchCache:
         Returns:
             Dictionary with cache statistics.
         """
-        total = len(self._cache)
-        expired = sum(1 for entry in self._cache.values() if entry.is_expired())
+        with self._lock:
+            total = len(self._cache)
+            expired = sum(1 for entry in self._cache.values() if entry.is_expired())
 
         return {
             "total_entries": total,
@@ -269,6 +298,59 @@ class RateLimiter:
         return None
 
 
+class _InFlightCalls:
+    """Lets concurrent callers asking for the same key share a single call.
+
+    The first caller runs the call; callers arriving before it finishes wait
+    for and receive the same result (or exception). Nothing is kept once the
+    call completes, so this complements rather than replaces SearchCache.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, Future[Any]] = {}
+        self._tasks: dict[str, asyncio.Future[Any]] = {}
+
+    def run(self, key: str, func: Callable[[], R]) -> R:
+        with self._lock:
+            future = self._calls.get(key)
+            is_owner = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+
+        if not is_owner:
+            logger.debug(f"Joining in-flight search for: {key[:50]}")
+            return cast(R, future.result())
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def arun(self, key: str, func: Callable[[], Awaitable[R]]) -> R:
+        # Joining at the event-loop level keeps waiters from holding worker threads
+        loop = asyncio.get_running_loop()
+        task = self._tasks.get(key)
+        if task is None or task.get_loop() is not loop:
+            task = self._tasks[key] = asyncio.ensure_future(func())
+            task.add_done_callback(partial(self._forget_task, key))
+        else:
+            logger.debug(f"Joining in-flight search for: {key[:50]}")
+        # Shield so one cancelled caller does not cancel the shared search
+        return cast(R, await asyncio.shield(task))
+
+    def _forget_task(self, key: str, task: "asyncio.Future[Any]") -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+
+
 class WebSearchTool:
     """Web search tool using Tavily with retry logic and caching.
 
@@ -315,6 +397,7 @@ class WebSearchTool:
         self.rate_limiter = RateLimiter(
             max_requests=rate_limit_requests, time_window=rate_limit_window
         )
+        self._in_flight = _InFlightCalls()
 
         # Initialize Tavily search
         self._tavily = TavilySearch(max_results=max_results)
@@ -352,8 +435,14 @@ class WebSearchTool:
         if self.cache:
             cached = self.cache.get(query, "web")
             if cached is not None:
-                return cached
+                # Copy, like the in-flight path, so callers never share the cached list
+                return list(cached)
+
+        # Concurrent callers asking the same query share one fetch
+        key = _search_key(query, "web")
+        return list(self._in_flight.run(key, partial(self._fetch, query)))
 
+    def _fetch(self, query: str) -> list[dict[str, Any]]:
         # Check rate limit
         try:
             self.rate_limiter.check_and_wait()
@@ -362,13 +451,13 @@ class WebSearchTool:
 
         # Execute search
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
 
             # Tavily returns results or dict with 'results' key
             data = self._tavily.invoke({"query": query})
             search_results = data.get("results", data) if isinstance(data, dict) else data
 
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             logger.debug(f"Search completed in {elapsed:.2f}s")
 
             if not isinstance(search_results, list):
@@ -386,6 +475,25 @@ class WebSearchTool:
             logger.error(f"Web search failed for query '{query[:50]}': {str(e)}")
             raise SearchError(f"Web search failed: {str(e)}") from e
 
+    async def asearch(self, query: str) -> list[dict[str, Any]]:
+        """Async variant of search.
+
+        Runs the blocking search (with its cache, rate limit and retries) in
+        a worker thread so several searches can be awaited concurrently.
+        Concurrent calls for the same query share one search.
+
+        Args:
+            query: Search query string.
+
+        Returns:
+            List of search result dictionaries with 'url' and 'content' keys.
+
+        Example:
+            >>> results = await tool.asearch("machine learning")
+        """
+        fetch = partial(asyncio.to_thread, self.search, query)
+        return list(await self._in_flight.arun(_search_key(query, "web"), fetch))
+
     def format_results(self, results: list[dict[str, Any]]) -> str:
         """Format search results for LLM context.
 
@@ -452,6 +560,7 @@ class WikipediaSearchTool:
         self.rate_limiter = RateLimiter(
             max_requests=rate_limit_requests, time_window=rate_limit_window
         )
+        self._in_flight = _InFlightCalls()
 
         logger.info(
             f"Initialized WikipediaSearchTool: load_max_docs={load_max_docs}, " f"cache={use_cache}"
@@ -492,6 +601,11 @@ class WikipediaSearchTool:
                     for item in cached
                 ]
 
+        # Concurrent callers asking the same query share one fetch
+        key = _search_key(query, "wikipedia")
+        return list(self._in_flight.run(key, partial(self._fetch, query)))
+
+    def _fetch(self, query: str) -> list[Any]:
         # Check rate limit
         try:
             self.rate_limiter.check_and_wait()
@@ -500,12 +614,12 @@ class WikipediaSearchTool:
 
         # Execute search
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
 
             loader = WikipediaLoader(query=query, load_max_docs=self.load_max_docs)
             documents = loader.load()
 
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             logger.debug(f"Wikipedia search completed in {elapsed:.2f}s")
             logger.info(f"Loaded {len(documents)} Wikipedia documents")
 
@@ -523,6 +637,24 @@ class WikipediaSearchTool:
             logger.error(f"Wikipedia search failed for query '{query[:50]}': {str(e)}")
             raise SearchError(f"Wikipedia search failed: {str(e)}") from e
 
+    async def asearch(self, query: str) -> list[Any]:
+        """Async variant of search.
+
+        WikipediaLoader is blocking, so the search runs in a worker thread.
+        Concurrent calls for the same query share one search.
+
+        Args:
+            query: Search query string.
+
+        Returns:
+            List of LangChain Document objects.
+
+        Example:
+            >>> docs = await tool.asearch("artificial intelligence")
+        """
+        fetch = partial(asyncio.to_thread, self.search, query)
+        return list(await self._in_flight.arun(_search_key(query, "wikipedia"), fetch))
+
     def format_results(self, documents: list[Any]) -> str:
         """Format Wikipedia documents for LLM context.
 
@@ -559,13 +691,21 @@ class SearchQueryGenerator:
         >>> print(query.search_query)
     """
 
-    def __init__(self, llm: ChatOpenAI | None = None):
+    def __init__(self, llm: ChatOpenAI | None = None, max_history: int | None = 6):
         """Initialize search query generator.
 
         Args:
             llm: Optional LLM instance for query generation.
+            max_history: Maximum number of conversation messages sent to the LLM.
+                The opening message is always kept and the rest are the most
+                recent ones, so prompt size stays bounded as the interview grows.
+                None sends the full conversation.
         """
+        if max_history is not None and max_history < 2:
+            raise ValueError(f"max_history must be at least 2, got {max_history}")
+
         self.llm = llm or ChatOpenAI(model="gpt-4o", temperature=0)
+        self.max_history = max_history
         logger.debug("Initialized SearchQueryGenerator")
 
     def generate_from_messages(self, messages: list[Any], detailed: bool = False) -> SearchQuery:
@@ -585,6 +725,44 @@ class SearchQueryGenerator:
             >>> query = generator.generate_from_messages([msg1, msg2])
             >>> print(query.search_query)
         """
+        structured_llm, llm_messages = self._prepare(messages, detailed)
+
+        try:
+            # Generate query
+            return self._check(cached_invoke(structured_llm, llm_messages))
+
+        except Exception as e:
+            logger.error(f"Failed to generate search query: {str(e)}")
+            raise SearchError(f"Query generation failed: {str(e)}") from e
+
+    async def agenerate_from_messages(
+        self, messages: list[Any], detailed: bool = False
+    ) -> SearchQuery:
+        """Async variant of generate_from_messages.
+
+        Args:
+            messages: List of conversation messages.
+            detailed: If True, use detailed instructions.
+
+        Returns:
+            SearchQuery instance with optimized query.
+
+        Raises:
+            SearchError: If query generation fails.
+
+        Example:
+            >>> query = await generator.agenerate_from_messages([msg1, msg2])
+        """
+        structured_llm, llm_messages = self._prepare(messages, detailed)
+
+        try:
+            return self._check(await acached_invoke(structured_llm, llm_messages))
+
+        except Exception as e:
+            logger.error(f"Failed to generate search query: {str(e)}")
+            raise SearchError(f"Query generation failed: {str(e)}") from e
+
+    def _prepare(self, messages: list[Any], detailed: bool) -> tuple[Any, list[Any]]:
         logger.info("Generating search query from conversation")
 
         if not messages:
@@ -596,19 +774,21 @@ class SearchQueryGenerator:
         # Enforce structured output
         structured_llm = self.llm.with_structured_output(SearchQuery)
 
-        try:
-            # Generate query
-            search_query = structured_llm.invoke([search_instructions] + messages)
+        # The query targets the latest question; keep the opening message for the
+        # topic and drop the middle of long conversations
+        max_history = self.max_history
+        if max_history is not None and len(messages) > max_history:
+            messages = [messages[0], *messages[1 - max_history :]]
 
-            if not isinstance(search_query, SearchQuery):
-                raise SearchError(f"Expected SearchQuery, got {type(search_query)}")
+        return structured_llm, [search_instructions, *messages]
 
-            logger.info(f"Generated search query: {search_query.search_query}")
-            return search_query
+    @staticmethod
+    def _check(search_query: Any) -> SearchQuery:
+        if not isinstance(search_query, SearchQuery):
+            raise SearchError(f"Expected SearchQuery, got {type(search_query)}")
 
-        except Exception as e:
-            logger.error(f"Failed to generate search query: {str(e)}")
-            raise SearchError(f"Query generation failed: {str(e)}") from e
+        logger.info(f"Generated search query: {search_query.search_query}")
+        return search_query
 
 
 # Factory function for creating search tools
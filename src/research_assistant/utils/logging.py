@@ -19,7 +19,7 @@ import logging
 import logging.config
 import sys
 import time
-from collections.abc import Callable, Generator
+from collections.abc import Callable, Generator, Mapping
 from contextlib import contextmanager
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
@@ -173,7 +173,7 @@ def setup_logging(
     log_file: str | None = None,
     console: bool = True,
     colored: bool = True,
-    module_levels: dict[str, str] | None = None,
+    module_levels: Mapping[str, str] | None = None,
 ) -> None:
     """Setup logging configuration.
 
@@ -632,7 +632,7 @@ def log_metrics_summary(logger: logging.Logger) -> None:
             )
 
 
-def configure_from_config(config: dict[str, Any]) -> None:
+def configure_from_config(config: Mapping[str, Any]) -> None:
     """Configure logging from config dictionary.
 
     Args:
@@ -13,7 +13,10 @@ from dotenv import load_dotenv
 from langchain_core.messages import AIMessage, HumanMessage
 
 from research_assistant.core.state import create_initial_research_state
-from research_assistant.graphs.interview_graph import build_interview_graph
+from research_assistant.graphs.interview_graph import (
+    build_interview_graph,
+    clear_interview_graph_cache,
+)
 from research_assistant.graphs.research_graph import build_research_graph, initiate_all_interviews
 
 load_dotenv()  # take environment variables
@@ -44,6 +47,37 @@ class TestInterviewGraphIntegration:
         # Graph should be compiled
         assert hasattr(graph, "invoke")
 
+    def test_default_interview_graph_is_reused(self, monkeypatch):
+        """Test that the default graph is cached until the cache is cleared."""
+        # Client constructors only check that keys are set; no requests are made
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setenv("TAVILY_API_KEY", "test-key")
+        clear_interview_graph_cache()
+
+        try:
+            graph = build_interview_graph()
+
+            assert build_interview_graph() is graph
+            assert build_interview_graph(detailed_prompts=True) is not graph
+
+            clear_interview_graph_cache()
+
+            assert build_interview_graph() is not graph
+        finally:
+            clear_interview_graph_cache()
+
+    def test_injected_dependencies_bypass_cache(
+        self, mock_llm, mock_web_search, mock_wikipedia_search
+    ):
+        """Test that graphs built with injected dependencies are never shared."""
+        kwargs = {
+            "llm": mock_llm,
+            "web_search_tool": mock_web_search,
+            "wiki_search_tool": mock_wikipedia_search,
+        }
+
+        assert build_interview_graph(**kwargs) is not build_interview_graph(**kwargs)
+
     def test_interview_graph_execution(
         self,
         sample_analyst,
@@ -172,6 +206,19 @@ class TestResearchGraphIntegration:
         assert isinstance(result, list)
         assert len(result) == len(sample_analysts)
 
+    def test_initiate_interviews_uses_max_interview_turns(self, sample_analysts):
+        """Test that each interview gets the research state's turn limit."""
+        state = {
+            "topic": "AI Safety",
+            "analysts": sample_analysts,
+            "human_analyst_feedback": "approve",
+            "max_interview_turns": 4,
+        }
+
+        result = initiate_all_interviews(state)
+
+        assert all(send.arg["max_num_turns"] == 4 for send in result)
+
     def test_initiate_interviews_not_approved(self):
         """Test interview initiation when not approved."""
         state = {"topic": "AI Safety", "analysts": [], "human_analyst_feedback": "need changes"}
@@ -0,0 +1,97 @@
+"""Unit tests for configuration loading, accessors and validation.
+
+Tests YAML file parsing, and that section accessors and validators reflect
+changes made to a config after it was loaded.
+"""
+
+import pytest
+import yaml
+from omegaconf import OmegaConf
+
+from research_assistant.config.config import (
+    get_llm_config,
+    get_research_config,
+    get_search_config,
+    load_config_from_file,
+    validate_config,
+)
+
+# ============================================================================
+# File Loading Tests
+# ============================================================================
+
+
+class TestLoadConfigFromFile:
+    """Test suite for load_config_from_file."""
+
+    def test_exponent_float_is_parsed_as_float(self, tmp_path):
+        """Test that floats without a decimal point are not read as strings."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("llm:\n  temperature: 1e-5\n")
+
+        cfg = load_config_from_file(str(config_file))
+
+        assert cfg.llm.temperature == pytest.approx(1e-5)
+        assert isinstance(cfg.llm.temperature, float)
+
+    def test_duplicate_keys_are_rejected(self, tmp_path):
+        """Test that a key defined twice in one mapping raises."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("llm:\n  model: gpt-4o\n  model: gpt-4o-mini\n")
+
+        with pytest.raises(yaml.constructor.ConstructorError, match="duplicate key"):
+            load_config_from_file(str(config_file))
+
+
+# ============================================================================
+# Section Accessor Tests
+# ============================================================================
+
+
+class TestSectionAccessors:
+    """Test suite for get_*_config accessors."""
+
+    def test_accessor_reflects_mutation(self, test_config):
+        """Test that a writable config is re-read after it is modified."""
+        assert get_llm_config(test_config)["model"] == "gpt-4o"
+
+        test_config.llm.model = "gpt-4o-mini"
+
+        assert get_llm_config(test_config)["model"] == "gpt-4o-mini"
+
+    def test_unlocked_config_is_re_read(self, test_config):
+        """Test that a config unlocked after a read-only access is re-read."""
+        OmegaConf.set_readonly(test_config, True)
+        get_research_config(test_config)
+
+        OmegaConf.set_readonly(test_config, False)
+        test_config.research.max_analysts = 4
+
+        assert get_research_config(test_config)["max_analysts"] == 4
+
+    def test_returned_view_is_read_only(self, test_config):
+        """Test that accessors return mappings that cannot be modified."""
+        search_cfg = get_search_config(test_config)
+
+        with pytest.raises(TypeError):
+            search_cfg["web"]["max_results"] = 10  # type: ignore[index]
+
+        assert test_config.search.web.max_results == 2
+
+
+# ============================================================================
+# Validation Tests
+# ============================================================================
+
+
+class TestValidateConfig:
+    """Test suite for validate_config."""
+
+    def test_validation_sees_mutation(self, test_config):
+        """Test that an invalid value set after a passing validation is caught."""
+        test_config.output = {"output_dir": "outputs"}
+        assert validate_config(test_config)
+
+        test_config.research.max_analysts = 50
+
+        assert not validate_config(test_config)
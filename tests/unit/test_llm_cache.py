@@ -0,0 +1,189 @@
+"""Unit tests for the LLM response cache.
+
+Tests cache keys, LRU/TTL eviction, SQLite persistence and cached invocation.
+"""
+
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from research_assistant.cache import (
+    LLMCache,
+    acached_invoke,
+    cache_key,
+    cached_invoke,
+    set_llm_cache,
+)
+
+
+class FakeChatModel:
+    """Minimal chat model exposing what the cache inspects, counting calls."""
+
+    def __init__(self, temperature=0.0, model_name="gpt-4o"):
+        self.model_name = model_name
+        self.temperature = temperature
+        self.calls = 0
+
+    def invoke(self, messages):
+        self.calls += 1
+        return AIMessage(content=f"response {self.calls}")
+
+    async def ainvoke(self, messages):
+        return self.invoke(messages)
+
+
+@pytest.fixture
+def llm_cache():
+    """Install a fresh process-wide LLM cache for the duration of a test."""
+    cache = LLMCache(max_size=8)
+    set_llm_cache(cache)
+    yield cache
+    set_llm_cache(None)
+
+
+@pytest.fixture
+def messages():
+    """Provide a fixed prompt."""
+    return [HumanMessage(content="Summarize AI safety research.")]
+
+
+# ============================================================================
+# Cache Key Tests
+# ============================================================================
+
+
+class TestCacheKey:
+    """Test suite for cache_key."""
+
+    def test_deterministic_call_has_stable_key(self, messages):
+        """Test that identical calls produce identical keys."""
+        key = cache_key("gpt-4o", messages, 0.0)
+
+        assert key is not None
+        assert key == cache_key("gpt-4o", list(messages), 0.0)
+
+    def test_non_zero_temperature_is_not_cacheable(self, messages):
+        """Test that sampled calls get no key."""
+        assert cache_key("gpt-4o", messages, 0.7) is None
+
+    def test_unknown_temperature_is_not_cacheable(self, messages):
+        """Test that calls with no known temperature get no key."""
+        assert cache_key("gpt-4o", messages, None) is None
+
+    def test_key_depends_on_model_and_tools(self, messages):
+        """Test that the model name and bound tools are part of the key."""
+        key = cache_key("gpt-4o", messages, 0.0)
+
+        assert key != cache_key("gpt-4o-mini", messages, 0.0)
+        assert key != cache_key("gpt-4o", messages, 0.0, tools={"schema": "Perspectives"})
+
+
+# ============================================================================
+# LLMCache Tests
+# ============================================================================
+
+
+class TestLLMCache:
+    """Test suite for LLMCache storage."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that a hit refreshes an entry so the oldest unused one is evicted."""
+        cache = LLMCache(max_size=2)
+        cache.set("first", "a")
+        cache.set("second", "b")
+        cache.get("first")
+
+        cache.set("third", "c")
+
+        assert cache.get("second") is None
+        assert cache.get("first") == "a"
+        assert cache.get("third") == "c"
+
+    def test_expired_entry_is_a_miss(self):
+        """Test that entries past their TTL are dropped."""
+        cache = LLMCache(ttl_seconds=-1)
+        cache.set("key", "value")
+
+        assert cache.get("key") is None
+        assert cache.get_stats()["entries"] == 0
+
+    def test_sqlite_round_trip(self, tmp_path):
+        """Test that entries written to SQLite are read by a new cache instance."""
+        db_path = str(tmp_path / "cache" / "llm.sqlite")
+        LLMCache(db_path=db_path).set("key", AIMessage(content="persisted"))
+
+        restored = LLMCache(db_path=db_path).get("key")
+
+        assert isinstance(restored, AIMessage)
+        assert restored.content == "persisted"
+
+    def test_clear_removes_persisted_entries(self, tmp_path):
+        """Test that clear() also empties the SQLite table."""
+        db_path = str(tmp_path / "llm.sqlite")
+        cache = LLMCache(db_path=db_path)
+        cache.set("key", "value")
+
+        cache.clear()
+
+        assert LLMCache(db_path=db_path).get("key") is None
+
+
+# ============================================================================
+# Cached Invocation Tests
+# ============================================================================
+
+
+class TestCachedInvoke:
+    """Test suite for cached_invoke."""
+
+    def test_repeated_deterministic_call_hits_cache(self, llm_cache, messages):
+        """Test that an identical temperature-0 call is served from the cache."""
+        llm = FakeChatModel(temperature=0)
+
+        first = cached_invoke(llm, messages)
+        second = cached_invoke(llm, messages)
+
+        assert llm.calls == 1
+        assert second is first
+        assert llm_cache.get_stats()["hits"] == 1
+
+    def test_sampled_call_bypasses_cache(self, llm_cache, messages):
+        """Test that temperature > 0 calls always reach the model."""
+        llm = FakeChatModel(temperature=0.7)
+
+        cached_invoke(llm, messages)
+        cached_invoke(llm, messages)
+
+        assert llm.calls == 2
+        assert llm_cache.get_stats()["entries"] == 0
+
+    def test_no_cache_configured(self, messages):
+        """Test that calls go straight to the model without a cache."""
+        set_llm_cache(None)
+        llm = FakeChatModel(temperature=0)
+
+        cached_invoke(llm, messages)
+        cached_invoke(llm, messages)
+
+        assert llm.calls == 2
+
+    def test_async_call_shares_entries_with_sync(self, llm_cache, messages):
+        """Test that acached_invoke reads and writes the same cache entries."""
+        llm = FakeChatModel(temperature=0)
+
+        first = asyncio.run(acached_invoke(llm, messages))
+        second = cached_invoke(llm, messages)
+        third = asyncio.run(acached_invoke(llm, messages))
+
+        assert llm.calls == 1
+        assert first is second is third
+
+    def test_async_sampled_call_bypasses_cache(self, llm_cache, messages):
+        """Test that acached_invoke never caches temperature > 0 calls."""
+        llm = FakeChatModel(temperature=1.0)
+
+        asyncio.run(acached_invoke(llm, messages))
+        asyncio.run(acached_invoke(llm, messages))
+
+        assert llm.calls == 2
@@ -218,6 +218,37 @@ class TestInterviewNodes:
 
         assert route == "save_interview"
 
+    def test_route_messages_uses_turn_counter(self, sample_interview_state):
+        """Test that routing trusts a running expert_turn_count."""
+        sample_interview_state["max_num_turns"] = 3
+        sample_interview_state["expert_turn_count"] = 3
+
+        # Messages hold only 2 expert answers; the counter decides
+        route = route_messages(sample_interview_state)
+
+        assert route == "save_interview"
+
+    def test_route_messages_zero_counter_falls_back_to_messages(self, sample_interview_state):
+        """Test that a defaulted counter of 0 doesn't hide earlier expert answers."""
+        sample_interview_state["max_num_turns"] = 2
+        sample_interview_state["expert_turn_count"] = 0
+
+        route = route_messages(sample_interview_state)
+
+        assert route == "save_interview"
+
+    def test_generate_answer_seeds_turn_counter(self, sample_interview_state, mock_llm):
+        """Test that the first answer counts expert answers already in state."""
+        result = generate_answer(sample_interview_state, llm=mock_llm)
+
+        # 2 earlier expert answers plus this one
+        assert result["expert_turn_count"] == 3
+
+        sample_interview_state["expert_turn_count"] = 3
+        result = generate_answer(sample_interview_state, llm=mock_llm)
+
+        assert result["expert_turn_count"] == 1
+
     def test_get_interview_statistics(self, sample_interview_state):
         """Test getting interview statistics."""
         sample_interview_state["context"] = ["doc1", "doc2"]
@@ -3,6 +3,8 @@
 Tests Pydantic models for analysts, perspectives, and search queries.
 """
 
+import json
+
 import pytest
 from pydantic import ValidationError
 
@@ -12,6 +14,8 @@ from research_assistant.core.schemas import (
     SearchQuery,
     create_analyst_from_dict,
     validate_analyst_diversity,
+    validate_analyst_list,
+    validate_analyst_list_json,
 )
 
 # ============================================================================
@@ -54,6 +58,21 @@ class TestAnalyst:
         assert len(focus) > 0
         assert focus.endswith(".")
 
+    def test_analyst_model_copy_updates_derived_strings(self, sample_analyst):
+        """Test that persona and descriptions follow a model_copy update."""
+        # Populate any per-instance state before copying
+        sample_analyst.persona
+        sample_analyst.get_short_description()
+        sample_analyst.get_focus_area()
+
+        updated = sample_analyst.model_copy(
+            update={"role": "Chef", "description": "Cooks food. Writes about kitchens too."}
+        )
+
+        assert "Role: Chef" in updated.persona
+        assert "(Chef at MIT)" in updated.get_short_description()
+        assert updated.get_focus_area() == "Cooks food."
+
     def test_analyst_name_validation_min_length(self):
         """Test name minimum length validation."""
         with pytest.raises(ValidationError) as exc_info:
@@ -90,6 +109,16 @@ class TestAnalyst:
                 description="Too short",  # Less than 5 words
             )
 
+    def test_analyst_description_word_count_message(self):
+        """Test the word-count error says how many words were given."""
+        with pytest.raises(ValidationError, match="at least 5 words, got 4"):
+            Analyst(
+                name="Dr. Test",
+                role="Researcher",
+                affiliation="University",
+                description="Focuses on safety research",
+            )
+
     def test_analyst_field_max_lengths(self):
         """Test field maximum length validation."""
         # Name too long
@@ -143,6 +172,16 @@ class TestPerspectives:
         not_found = sample_perspectives.get_analyst_by_name("Nonexistent")
         assert not_found is None
 
+    def test_get_analyst_by_name_after_model_copy(self, sample_perspectives, sample_analyst):
+        """Test that lookups see the analysts of a model_copy update."""
+        sample_perspectives.get_analyst_by_name("Dr. Alice Smith")
+        renamed = sample_analyst.model_copy(update={"name": "Dr. Carol White"})
+
+        updated = sample_perspectives.model_copy(update={"analysts": [renamed]})
+
+        assert updated.get_analyst_by_name("Dr. Carol White") is renamed
+        assert updated.get_analyst_by_name("Dr. Alice Smith") is None
+
     def test_get_affiliations(self, sample_perspectives):
         """Test getting unique affiliations."""
         affiliations = sample_perspectives.get_affiliations()
@@ -160,6 +199,16 @@ class TestPerspectives:
         assert "Dr. Alice Smith" in summary
         assert "Prof. Bob Johnson" in summary
 
+    def test_get_summary_after_model_copy(self, sample_perspectives, sample_analyst):
+        """Test that the summary reflects the analysts of a model_copy update."""
+        sample_perspectives.get_summary()
+
+        updated = sample_perspectives.model_copy(update={"analysts": [sample_analyst]})
+        summary = updated.get_summary()
+
+        assert "Analyst Team (1 members)" in summary
+        assert "Prof. Bob Johnson" not in summary
+
     def test_unique_names_validation(self, sample_analyst):
         """Test that duplicate analyst names are rejected."""
         with pytest.raises(ValidationError) as exc_info:
@@ -269,6 +318,32 @@ class TestSearchQuery:
 class TestSchemaUtilities:
     """Test suite for schema utility functions."""
 
+    def test_validate_analyst_list(self, sample_analysts):
+        """Test validating a list of analyst dicts in one call."""
+        data = [a.model_dump() for a in sample_analysts]
+
+        analysts = validate_analyst_list(data)
+
+        assert analysts == sample_analysts
+
+    def test_validate_analyst_list_rejects_invalid_item(self, sample_analyst):
+        """Test that one invalid analyst fails the whole list."""
+        data = [sample_analyst.model_dump(), {**sample_analyst.model_dump(), "name": "X"}]
+
+        with pytest.raises(ValidationError):
+            validate_analyst_list(data)
+
+    def test_validate_analyst_list_json(self, sample_analysts):
+        """Test parsing and validating a JSON array of analysts."""
+        payload = json.dumps([a.model_dump() for a in sample_analysts]).encode()
+
+        assert validate_analyst_list_json(payload) == sample_analysts
+
+    def test_validate_analyst_list_json_malformed(self):
+        """Test that malformed JSON raises a ValidationError."""
+        with pytest.raises(ValidationError):
+            validate_analyst_list_json(b"[{not json")
+
     def test_validate_analyst_diversity_good(self, sample_analysts):
         """Test diversity validation with diverse analysts."""
         is_diverse = validate_analyst_diversity(sample_analysts)
@@ -0,0 +1,216 @@
+"""Unit tests for search tools.
+
+Tests in-flight call sharing and search result caching without network access.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from research_assistant.tools.search import (
+    SearchCache,
+    WebSearchTool,
+    WikipediaSearchTool,
+    _InFlightCalls,
+)
+
+# ============================================================================
+# In-Flight Call Sharing Tests
+# ============================================================================
+
+
+class TestInFlightCalls:
+    """Test suite for single-flight sharing of concurrent calls."""
+
+    def _run_concurrently(self, in_flight, func, callers=3):
+        """Run the same key from several threads while the first call is blocked."""
+        results, errors = [], []
+
+        def call():
+            try:
+                results.append(in_flight.run("key", func))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(callers)]
+        for thread in threads:
+            thread.start()
+            time.sleep(0.05)  # Let each caller reach run() before the next
+        return threads, results, errors
+
+    def test_concurrent_calls_share_one_result(self):
+        """Test that callers arriving during a call share its result."""
+        in_flight = _InFlightCalls()
+        release = threading.Event()
+        calls = []
+
+        def func():
+            calls.append(1)
+            release.wait(timeout=5)
+            return ["result"]
+
+        threads, results, errors = self._run_concurrently(in_flight, func)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(calls) == 1
+        assert results == [["result"]] * 3
+        assert not errors
+
+    def test_exception_propagates_to_waiters(self):
+        """Test that every waiting caller receives the owner's exception."""
+        in_flight = _InFlightCalls()
+        release = threading.Event()
+
+        def func():
+            release.wait(timeout=5)
+            raise RuntimeError("search failed")
+
+        threads, results, errors = self._run_concurrently(in_flight, func)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert not results
+        assert len(errors) == 3
+        assert all(str(e) == "search failed" for e in errors)
+
+    def test_completed_call_is_not_kept(self):
+        """Test that a later call runs again once the first has finished."""
+        in_flight = _InFlightCalls()
+        calls = []
+
+        in_flight.run("key", lambda: calls.append(1))
+        in_flight.run("key", lambda: calls.append(1))
+
+        assert len(calls) == 2
+
+    def test_async_calls_share_one_task(self):
+        """Test that concurrent awaits for the same key share one call."""
+        in_flight = _InFlightCalls()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return ["result"]
+
+        async def main():
+            return await asyncio.gather(*(in_flight.arun("key", fetch) for _ in range(3)))
+
+        assert asyncio.run(main()) == [["result"]] * 3
+        assert len(calls) == 1
+
+    def test_async_exception_propagates_to_waiters(self):
+        """Test that every awaiting caller receives the shared exception."""
+        in_flight = _InFlightCalls()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("search failed")
+
+        async def main():
+            return await asyncio.gather(
+                *(in_flight.arun("key", fetch) for _ in range(3)), return_exceptions=True
+            )
+
+        errors = asyncio.run(main())
+
+        assert [str(e) for e in errors] == ["search failed"] * 3
+
+
+# ============================================================================
+# Search Cache Tests
+# ============================================================================
+
+
+class TestSearchCache:
+    """Test suite for the LRU search result cache."""
+
+    def test_key_normalizes_case_and_whitespace(self):
+        """Test that case and whitespace variants of a query share an entry."""
+        cache = SearchCache()
+        cache.set("Quantum  Computing ", "web", [{"url": "u"}])
+
+        assert cache.get("quantum computing", "web") == [{"url": "u"}]
+        assert cache.get("\tQUANTUM computing", "web") == [{"url": "u"}]
+
+    def test_key_includes_search_type(self):
+        """Test that web and Wikipedia results are cached separately."""
+        cache = SearchCache()
+        cache.set("ai", "web", [{"url": "u"}])
+
+        assert cache.get("ai", "wikipedia") is None
+
+    def test_evicts_least_recently_used(self):
+        """Test that a hit refreshes an entry so the oldest unused one is evicted."""
+        cache = SearchCache(max_size=2)
+        cache.set("first", "web", [])
+        cache.set("second", "web", [])
+        cache.get("first", "web")
+
+        cache.set("third", "web", [])
+
+        assert cache.get("second", "web") is None
+        assert cache.get("first", "web") == []
+        assert cache.get("third", "web") == []
+
+    def test_expired_entry_is_dropped(self):
+        """Test that an entry past its TTL is a miss and is removed."""
+        cache = SearchCache()
+        cache.set("ai", "web", [{"url": "u"}], ttl_seconds=-1)
+
+        assert cache.get("ai", "web") is None
+        assert cache.get_stats()["total_entries"] == 0
+
+
+# ============================================================================
+# Search Tool Tests
+# ============================================================================
+
+
+class TestSearchToolSharing:
+    """Test suite for query normalization across cache and in-flight paths."""
+
+    @pytest.fixture
+    def wiki_tool(self, monkeypatch):
+        """Wikipedia tool whose fetch is counted instead of hitting the network."""
+        tool = WikipediaSearchTool(use_cache=False)
+        tool.fetched = []
+
+        def fake_fetch(query):
+            tool.fetched.append(query)
+            time.sleep(0.05)
+            return [f"doc for {query}"]
+
+        monkeypatch.setattr(tool, "_fetch", fake_fetch)
+        return tool
+
+    def test_async_variants_of_one_query_share_a_fetch(self, wiki_tool):
+        """Test that case and whitespace variants share one in-flight search."""
+
+        async def main():
+            return await asyncio.gather(
+                wiki_tool.asearch("Quantum  Computing"),
+                wiki_tool.asearch("quantum computing "),
+            )
+
+        first, second = asyncio.run(main())
+
+        assert len(wiki_tool.fetched) == 1
+        assert first == second
+        assert first is not second
+
+    def test_cache_hit_returns_a_copy(self, monkeypatch):
+        """Test that a cache hit does not hand out the cached list itself."""
+        monkeypatch.setenv("TAVILY_API_KEY", "test-key")
+        tool = WebSearchTool()
+        tool.cache.set("ai", "web", [{"url": "https://example.com", "content": "text"}])
+
+        first = tool.search("ai")
+        first.clear()
+
+        assert len(tool.search("AI")) == 1
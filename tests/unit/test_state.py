@@ -0,0 +1,139 @@
+"""Unit tests for state helpers.
+
+Tests state merging and checkpoint serialization.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from research_assistant.core.schemas import Analyst
+from research_assistant.core.state import (
+    analyst_to_dict,
+    deserialize_state_from_checkpoint,
+    deserialize_state_from_json_bytes,
+    merge_state_updates,
+    serialize_state_to_json_bytes,
+    validate_interview_state,
+)
+
+# ============================================================================
+# State Validation Tests
+# ============================================================================
+
+
+class TestValidateInterviewState:
+    """Test suite for validate_interview_state."""
+
+    def test_valid_state_passes(self, sample_interview_state):
+        """Test that a state holding an Analyst is valid."""
+        assert validate_interview_state(sample_interview_state)
+
+    def test_analyst_dict_is_rejected(self, sample_interview_state, sample_analyst):
+        """Test that an AnalystDict is rejected since the nodes need an Analyst."""
+        sample_interview_state["analyst"] = analyst_to_dict(sample_analyst)
+
+        with pytest.raises(ValueError, match="analyst must be an Analyst instance"):
+            validate_interview_state(sample_interview_state)
+
+# ============================================================================
+# State Merge Tests
+# ============================================================================
+
+
+class TestMergeStateUpdates:
+    """Test suite for merge_state_updates."""
+
+    def test_additive_fields_are_appended(self):
+        """Test that operator.add fields extend rather than replace."""
+        merged = merge_state_updates(
+            {"sections": ["intro"], "topic": "AI"}, {"sections": ["body"], "topic": "ML"}
+        )
+
+        assert merged["sections"] == ["intro", "body"]
+        assert merged["topic"] == "ML"
+
+    def test_counter_fields_are_summed(self):
+        """Test that counter fields add the update to the current value."""
+        merged = merge_state_updates({"expert_turn_count": 2}, {"expert_turn_count": 1})
+
+        assert merged["expert_turn_count"] == 3
+
+    def test_default_merge_does_not_alias_inputs(self):
+        """Test that the default merge leaves the current state and its lists untouched."""
+        sections = ["intro"]
+        current = {"sections": sections}
+
+        merged = merge_state_updates(current, {"sections": ["body"]})
+
+        assert merged is not current
+        assert merged["sections"] is not sections
+        assert sections == ["intro"]
+        assert current == {"sections": ["intro"]}
+
+    def test_in_place_merge_extends_existing_list(self):
+        """Test that an in-place merge mutates the current state and its lists."""
+        sections = ["intro"]
+        current = {"sections": sections, "expert_turn_count": 1}
+
+        merged = merge_state_updates(
+            current, {"sections": ["body"], "expert_turn_count": 1}, in_place=True
+        )
+
+        assert merged is current
+        assert merged["sections"] is sections
+        assert sections == ["intro", "body"]
+        assert merged["expert_turn_count"] == 2
+
+    def test_in_place_merge_does_not_mutate_update_lists(self):
+        """Test that extending the current list leaves the update's list alone."""
+        update_sections = ["body"]
+        current = {"sections": ["intro"]}
+
+        merge_state_updates(current, {"sections": update_sections}, in_place=True)
+        current["sections"].append("conclusion")
+
+        assert update_sections == ["body"]
+
+    def test_non_list_value_is_appended(self):
+        """Test that a single item update is appended to an additive list."""
+        merged = merge_state_updates({"context": ["doc1"]}, {"context": "doc2"})
+
+        assert merged["context"] == ["doc1", "doc2"]
+
+
+# ============================================================================
+# JSON Checkpoint Tests
+# ============================================================================
+
+
+class TestJsonCheckpoint:
+    """Test suite for JSON bytes checkpoint serialization."""
+
+    def test_round_trip_restores_analysts(self, sample_research_state):
+        """Test that analysts come back as Analyst models with the same fields."""
+        payload = serialize_state_to_json_bytes(sample_research_state)
+
+        restored = deserialize_state_from_json_bytes(payload)
+
+        assert isinstance(payload, bytes)
+        assert restored["topic"] == sample_research_state["topic"]
+        assert all(isinstance(a, Analyst) for a in restored["analysts"])
+        assert restored["analysts"] == sample_research_state["analysts"]
+
+    def test_checkpoint_is_validated_by_default(self):
+        """Test that checkpoint data is validated unless marked trusted."""
+        data = {
+            "topic": "AI",
+            "analysts": [{"name": "X", "role": "", "affiliation": "", "description": ""}],
+        }
+
+        with pytest.raises(ValidationError):
+            deserialize_state_from_checkpoint(data)
+
+    def test_payload_is_validated_by_default(self):
+        """Test that JSON payloads are validated unless marked trusted."""
+        payload = b'{"topic": "AI", "analysts": [{"name": "X", "role": "", '
+        payload += b'"affiliation": "", "description": ""}]}'
+
+        with pytest.raises(ValidationError):
+            deserialize_state_from_json_bytes(payload)
@@ -0,0 +1,52 @@
+"""Unit tests for graph visualization helpers.
+
+Tests that Mermaid renders are cached per graph structure without calling
+the rendering service.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from research_assistant.graphs import visualization
+from research_assistant.graphs.visualization import render_mermaid_png
+
+
+@pytest.fixture
+def draw_png(monkeypatch):
+    """Replace the Mermaid service call with a mock and start from an empty cache."""
+    mock = Mock(side_effect=lambda mermaid_syntax: mermaid_syntax.encode())
+    monkeypatch.setattr("langchain_core.runnables.graph_mermaid.draw_mermaid_png", mock)
+    visualization._mermaid_source_to_png.cache_clear()
+    yield mock
+    visualization._mermaid_source_to_png.cache_clear()
+
+
+def _graph(mermaid_source):
+    """Build a stand-in compiled graph whose drawable renders the given source."""
+    graph = Mock()
+    graph.get_graph.return_value.draw_mermaid.return_value = mermaid_source
+    return graph
+
+
+class TestRenderMermaidPng:
+    """Test suite for render_mermaid_png."""
+
+    def test_same_structure_is_rendered_once(self, draw_png):
+        """Test that graphs with identical Mermaid source share one render."""
+        first = render_mermaid_png(_graph("graph TD; a-->b"))
+        second = render_mermaid_png(_graph("graph TD; a-->b"))
+
+        assert first == second == b"graph TD; a-->b"
+        assert draw_png.call_count == 1
+
+    def test_different_structure_is_rendered_again(self, draw_png):
+        """Test that a changed graph is not served a stale image."""
+        render_mermaid_png(_graph("graph TD; a-->b"))
+        render_mermaid_png(_graph("graph TD; a-->c"))
+
+        assert draw_png.call_count == 2
+
+    def test_cache_is_bounded(self):
+        """Test that the render cache has a size limit."""
+        assert visualization._mermaid_source_to_png.cache_info().maxsize is not None